@@ -8,18 +8,34 @@ Now with Team Collaboration support — Morty's can work together!
 """
 
 import argparse
+import atexit
+import fcntl
+import functools
+import hashlib
 import json
 import os
 import re
+import select
 import subprocess
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
 
+# orjson is an optional speedup for the JSON hot paths (ticket/team/message
+# load+save, log lines); stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 err_console = Console(stderr=True)
 
@@ -355,12 +371,22 @@ def _clean_subprocess_env() -> dict:
     return {k: v for k, v in os.environ.items() if k not in _SUBPROCESS_ENV_STRIP_KEYS}
 
 
+_CTO_ROOTS: dict[str, Path] = {}
+
+
 def find_cto_root(start=None) -> Path:
-    current = Path(start or os.getcwd()).resolve()
+    # Plain-string os.path walk (one Path built, for the result) and a
+    # per-start-dir memo: delegation resolves the root several times per run.
+    start = os.fspath(start or os.getcwd())
+    root = _CTO_ROOTS.get(start)
+    if root is not None:
+        return root
+    current = os.path.realpath(start)
     while True:
-        if (current / ".cto").is_dir():
-            return current
-        parent = current.parent
+        if os.path.isdir(os.path.join(current, ".cto")):
+            root = _CTO_ROOTS[start] = Path(current)
+            return root
+        parent = os.path.dirname(current)
         if parent == current:
             err_console.print("[red]Error: No .cto/ directory found.[/red]")
             sys.exit(1)
@@ -371,14 +397,51 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
 def load_json(fp: Path) -> dict:
-    with open(fp) as f:
-        return json.load(f)
+    return _json_loads(fp.read_bytes())
 
 
 def save_json(fp: Path, data: dict):
-    with open(fp, "w") as f:
-        json.dump(data, f, indent=2)
+    """Write *data* atomically: serialize once, one write to a temp file, os.replace.
+
+    Readers (team status rows, MCP tools, concurrent member delegations)
+    never see a half-written file. The temp name carries the pid so
+    concurrent delegate.py processes saving the same file don't collide.
+    """
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2).encode()
+    tmp_fp = fp.with_suffix(f"{fp.suffix}.{os.getpid()}.tmp")
+    fd = os.open(tmp_fp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_fp, fp)
+
+
+def _json_dumps(data) -> str:
+    """Serialize *data* to a compact JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(d: Path) -> Path:
+    """mkdir -p *d* once per process; later calls are a set lookup."""
+    if d not in _ENSURED_DIRS:
+        d.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(d)
+    return d
 
 
 def load_ticket(root: Path, ticket_id: str) -> dict:
@@ -398,45 +461,120 @@ def load_config(root: Path) -> dict:
     return load_json(root / ".cto" / "config.json")
 
 
+_LOG_FLUSH_INTERVAL = 0.05  # seconds a buffered log line may wait before hitting disk
+_LOG_MAX_BUFFERED = 256     # flush eagerly past this many pending lines
+
+
+class LogWriter:
+    """Buffered appender for the daily .cto/logs/YYYY-MM-DD.jsonl file.
+
+    append_log() used to open, write and close the log on every entry. This
+    keeps the current day's file open, queues encoded lines, and flushes them
+    with a single os.writev() after _LOG_FLUSH_INTERVAL seconds, when the
+    buffer fills, when the target file changes (new day / other root), or
+    at interpreter exit. Timed flushes come from one long-lived daemon thread
+    rather than a fresh threading.Timer per batch.
+    """
+
+    def __init__(self, flush_interval: float = _LOG_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending = threading.Condition(self._lock)
+        self._fh = None
+        self._path: Optional[Path] = None
+        self._buf: list[bytes] = []
+        self._flusher: Optional[threading.Thread] = None
+
+    def write(self, fp: Path, line: bytes):
+        """Queue one encoded JSONL line for *fp*."""
+        with self._lock:
+            if fp != self._path:
+                self._flush_locked()
+                self._close_locked()
+                # Only reached on the first line of a day (or another root),
+                # so the logs directory is ensured once per file, not per entry.
+                _ensure_dir(fp.parent)
+                self._fh = open(fp, "ab", buffering=0)
+                self._path = fp
+            self._buf.append(line)
+            if len(self._buf) >= _LOG_MAX_BUFFERED:
+                self._flush_locked()
+            elif len(self._buf) == 1:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_loop, name="cto-log-flush", daemon=True)
+                    self._flusher.start()
+                self._pending.notify()
+
+    def flush(self):
+        """Write all pending lines to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush pending lines and release the file handle."""
+        with self._lock:
+            self._flush_locked()
+            self._close_locked()
+
+    def _flush_loop(self):
+        with self._lock:
+            while True:
+                while not self._buf:
+                    self._pending.wait()
+                # Let lines logged shortly after the first one share its write.
+                self._pending.wait(self.flush_interval)
+                try:
+                    self._flush_locked()
+                except OSError:
+                    # A failed batch (disk full, file gone) is dropped; letting
+                    # the error kill this thread would stop every later timed
+                    # flush, since write() only starts one flusher.
+                    self._buf.clear()
+
+    def _flush_locked(self):
+        if not self._buf or self._fh is None:
+            return
+        fd = self._fh.fileno()
+        buf = self._buf
+        while buf:
+            if hasattr(os, "writev"):
+                written = os.writev(fd, buf)
+            else:
+                written = os.write(fd, b"".join(buf))
+            # A short write leaves the tail of the batch unwritten: drop the
+            # fully written lines and retry from where the write stopped.
+            done = 0
+            while done < len(buf) and written >= len(buf[done]):
+                written -= len(buf[done])
+                done += 1
+            del buf[:done]
+            if written:
+                buf[0] = buf[0][written:]
+
+    def _close_locked(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._path = None
+
+
+_LOG_WRITER = LogWriter()
+atexit.register(_LOG_WRITER.close)
+
+
 def append_log(root: Path, entry: dict):
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    ld = root / ".cto" / "logs"
-    ld.mkdir(parents=True, exist_ok=True)
-    fp = ld / f"{today}.jsonl"
-    with open(fp, "a") as f:
-        f.write(redact_secrets(json.dumps(entry)) + "\n")
-
-
-def load_adrs(root: Path) -> str:
-    """Load all Architecture Decision Records."""
-    dd = root / ".cto" / "decisions"
-    if not dd.exists():
-        return "(No ADRs yet)"
-    adrs = []
-    for fp in sorted(dd.glob("*.md")):
-        with open(fp) as f:
-            adrs.append(f"### {fp.stem}\n{f.read()}")
-    return "\n\n".join(adrs) if adrs else "(No ADRs yet)"
-
+    fp = root / ".cto" / "logs" / f"{today}.jsonl"
+    _LOG_WRITER.write(fp, (redact_secrets(_json_dumps(entry)) + "\n").encode())
 
-def get_related_tickets(root: Path, ticket: dict) -> str:
-    """Gather context from dependency and sibling tickets."""
-    td = root / ".cto" / "tickets"
-    related = []
-    dep_ids = ticket.get("dependencies") or []
-    parent_id = ticket.get("parent_ticket")
-    all_ids = set(dep_ids)
-    if parent_id:
-        all_ids.add(parent_id)
 
-    for tid in all_ids:
-        fp = td / f"{tid}.json"
-        if fp.exists():
-            t = load_json(fp)
-            status = t["status"]
-            output = t.get("agent_output") or "(no output yet)"
-            related.append(f"- {tid} [{status}]: {t['title']}\n  Output: {output[:200]}")
-    return "\n".join(related) if related else "(none)"
+def _adr_names(root: Path) -> list[str]:
+    """Sorted ADR names (file stems) from one directory read, no Path objects."""
+    try:
+        with os.scandir(root / ".cto" / "decisions") as it:
+            return sorted(e.name[:-3] for e in it if e.name.endswith(".md") and e.is_file())
+    except FileNotFoundError:
+        return []
 
 
 def load_agent_card(agent_role: str, root: Optional[Path] = None) -> dict:
@@ -458,24 +596,133 @@ def load_agent_card(agent_role: str, root: Optional[Path] = None) -> dict:
     return {}
 
 
-def get_project_structure(root: Path) -> str:
-    """Get a compact view of the project file structure (excluding .cto)."""
-    result = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        # skip hidden dirs and .cto
-        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-        rel = os.path.relpath(dirpath, root)
-        depth = rel.count(os.sep) if rel != "." else 0
-        if depth > 3:
-            continue
+_STRUCTURE_MAX_DEPTH = 3
+_STRUCTURE_MAX_FILES_PER_DIR = 15
+_STRUCTURE_MAX_LINES = 80
+
+
+def get_project_structure(root: Path, use_cache: bool = True) -> str:
+    """Get a compact view of the project file structure (excluding .cto).
+
+    Memoized on the mtimes of the root and its top-level directories (see
+    _structure_version). Adding or removing entries two or more levels down
+    doesn't change that key, so the overview can lag behind deep edits until
+    something at the top changes. use_cache=False (delegate --no-cache)
+    always walks the tree afresh.
+    """
+    if not use_cache:
+        return _walk_project_structure(root)
+    return _project_structure_cached(root, _structure_version(root))
+
+
+def _structure_version(root: Path) -> str:
+    """Cache key for the structure walk: one scandir of root, no deeper.
+
+    A digest of the root's mtime and each visible top-level directory's
+    mtime, so files added to or removed from src/, tests/ etc. invalidate
+    the cached overview, not just changes to the root listing itself.
+    """
+    parts = [str(root.stat().st_mtime_ns)]
+    with os.scandir(root) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if entry.name[0] == ".":
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    parts.append(f"{entry.name}:{entry.stat(follow_symlinks=False).st_mtime_ns}")
+            except OSError:
+                continue
+    return hashlib.sha1("\0".join(parts).encode()).hexdigest()
+
+
+_STRUCTURE_CACHE_HEADER = "# structure_version="
+
+
+@functools.lru_cache(maxsize=8)
+def _project_structure_cached(root: Path, version: str) -> str:
+    """Return the structure for *root*, reusing .cto/.cache/structure.txt.
+
+    Every delegation is a fresh delegate.py process, so the lru_cache alone
+    only helps within one run; the on-disk copy carries the walk across
+    processes. Its first line records the _structure_version it was built
+    for, and any mismatch (or unreadable file) falls through to a fresh walk.
+    It's replaced atomically: parallel delegate.py processes may read it while
+    another one rewrites it.
+    """
+    cache_fp = root / ".cto" / ".cache" / "structure.txt"
+    header = f"{_STRUCTURE_CACHE_HEADER}{version}\n"
+    try:
+        cached = cache_fp.read_text()
+        if cached.startswith(header):
+            return cached[len(header):]
+    except OSError:
+        pass
+    structure = _walk_project_structure(root)
+    try:
+        _ensure_dir(cache_fp.parent)
+        tmp_fp = cache_fp.with_suffix(f"{cache_fp.suffix}.{os.getpid()}.tmp")
+        tmp_fp.write_text(header + structure)
+        os.replace(tmp_fp, cache_fp)
+    except OSError:
+        pass  # cache is best-effort — a read-only tree just re-walks next time
+    return structure
+
+
+def _walk_project_structure(root: Path) -> str:
+    """Walk *root* for get_project_structure().
+
+    Walks with os.scandir so directory/file classification comes from the
+    cached dirent type, never descends past _STRUCTURE_MAX_DEPTH, and stops
+    as soon as _STRUCTURE_MAX_LINES lines have been produced — subtrees that
+    would be truncated away are never stat'd.
+    """
+    result: list[str] = []
+
+    def walk(path: str, name: str, level: int):
+        # Indent depth mirrors the historical os.walk output: the root and its
+        # direct children share depth 0, each level below adds one.
+        depth = max(level - 1, 0)
+        if len(result) >= _STRUCTURE_MAX_LINES:
+            return
         indent = "  " * depth
-        dirname = os.path.basename(dirpath) if rel != "." else str(root.name)
-        result.append(f"{indent}{dirname}/")
-        for fn in filenames[:15]:  # cap files per dir
-            result.append(f"{indent}  {fn}")
-        if len(filenames) > 15:
-            result.append(f"{indent}  ... and {len(filenames)-15} more")
-    return "\n".join(result[:80])  # cap total lines
+        # Files past the per-dir cap are only counted, never kept, so a huge
+        # flat directory costs one dirent pass rather than a list of names.
+        dirs, shown = [], []
+        n_files = 0
+        budget = _STRUCTURE_MAX_LINES - len(result) - 1  # lines left after this dir's header
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if len(shown) >= budget:
+                        break  # file lines alone fill the cap; nothing later is kept
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # skip hidden dirs and .cto
+                        if entry.name[0] != ".":
+                            dirs.append(entry)
+                    else:
+                        if n_files < _STRUCTURE_MAX_FILES_PER_DIR:
+                            shown.append(f"{indent}  {entry.name}")
+                        n_files += 1
+        except OSError:
+            return
+        result.append(f"{indent}{name}/")
+        result.extend(shown)
+        if n_files > _STRUCTURE_MAX_FILES_PER_DIR:
+            result.append(f"{indent}  ... and {n_files - _STRUCTURE_MAX_FILES_PER_DIR} more")
+        if level > _STRUCTURE_MAX_DEPTH:  # children would sit past the depth cap
+            return
+        for entry in dirs:
+            if len(result) >= _STRUCTURE_MAX_LINES:
+                return
+            if not entry.is_symlink():  # match os.walk(followlinks=False)
+                walk(entry.path, entry.name, level + 1)
+
+    walk(str(root), str(root.name), 0)
+    return "\n".join(result[:_STRUCTURE_MAX_LINES])  # cap total lines
 
 
 # ── Team Context Functions ───────────────────────────────────────────────────
@@ -496,6 +743,28 @@ def load_team_session(root: Path, team_id: str) -> Optional[dict]:
     return load_json(team_fp)
 
 
+@contextmanager
+def _team_session_lock(root: Path, team_id: str):
+    """Load a team session under an exclusive flock; save it back on exit.
+
+    Yields the team dict, or None when the session doesn't exist. Member
+    delegations running side by side (--all-members) update the same file,
+    so each read-modify-write holds the lock throughout, and the file is only
+    rewritten when the dict actually changed.
+    """
+    team_fp = root / ".cto" / "teams" / "active" / f"{team_id}.json"
+    if not team_fp.exists():
+        yield None
+        return
+    with open(team_fp.with_suffix(".lock"), "a") as lock_f:
+        fcntl.flock(lock_f, fcntl.LOCK_EX)
+        team = load_json(team_fp)
+        before = _json_dumps(team)
+        yield team
+        if _json_dumps(team) != before:
+            save_json(team_fp, team)
+
+
 def get_team_messages(root: Path, team_id: str, for_role: str) -> list[dict]:
     """Get messages relevant to a specific role."""
     msg_dir = root / ".cto" / "teams" / "messages" / team_id
@@ -569,7 +838,7 @@ Team lead: {team['coordination']['lead']}
     if ctx and ctx.get("interfaces"):
         interface_lines = []
         for i in ctx["interfaces"][-3:]:  # Last 3 interfaces
-            interface_lines.append(f"  - [{i['author']}]: {json.dumps(i['interface'])[:100]}")
+            interface_lines.append(f"  - [{i['author']}]: {_json_dumps(i['interface'])[:100]}")
         sections.append("**Defined Interfaces**:\n" + "\n".join(interface_lines))
 
     # Recent messages
@@ -647,13 +916,30 @@ Omit arrays that are empty — Rick doesn't want JSON noise.
     return "\n\n".join(sections)
 
 
+# Team-output parsing patterns, compiled once at import instead of per call.
+_HANDOFF_JSON_RE = re.compile(r"<handoff_json>\s*(.*?)\s*</handoff_json>", re.DOTALL)
+_TEAM_SECTION_RE = re.compile(r"###\s*Team Updates\s*\n(.*?)(?:\n###|\Z)", re.DOTALL | re.IGNORECASE)
+# One alternation covers every team-section field, so the section is scanned
+# once with finditer instead of once per field.
+_TEAM_FIELD_RE = re.compile(
+    r"\*\*(Messages to team|Decisions made|Blocked on)\*\*:\s*\n(.*?)(?=\n\*\*|\Z)",
+    re.DOTALL,
+)
+_TEAM_MSG_LINE_RE = re.compile(r"@(\S+):\s*(.+)")
+# One "- item" bullet per line, captured without its leading dashes/spaces or
+# trailing whitespace — the per-line strip().lstrip("- ") done in C.
+_TEAM_LIST_ITEM_RE = re.compile(r"^[^\S\n]*[- ]*(.*?)\s*$", re.MULTILINE)
+
+
 def _extract_handoff_json(output: str) -> Optional[dict]:
     """Extract structured handoff envelope from <handoff_json>...</handoff_json> block."""
-    match = re.search(r"<handoff_json>\s*(.*?)\s*</handoff_json>", output, re.DOTALL)
+    if "<handoff_json>" not in output:  # C-level substring scan; skips the regex
+        return None
+    match = _HANDOFF_JSON_RE.search(output)
     if not match:
         return None
     try:
-        return json.loads(match.group(1))
+        return _json_loads(match.group(1))
     except json.JSONDecodeError:
         return None
 
@@ -707,18 +993,20 @@ def parse_team_agent_output(output: str) -> dict:
         return result
 
     # ── Fallback: regex-based markdown parsing (backwards compatibility) ──
-    team_match = re.search(r"###\s*Team Updates\s*\n(.*?)(?:\n###|\Z)", output, re.DOTALL | re.IGNORECASE)
+    team_match = _TEAM_SECTION_RE.search(output)
     if not team_match:
         return result
 
-    team_section = team_match.group(1)
+    # Single pass over the section; only the first occurrence of each field counts.
+    fields: dict[str, str] = {}
+    for fm in _TEAM_FIELD_RE.finditer(team_match.group(1)):
+        fields.setdefault(fm.group(1), fm.group(2))
 
     # Parse messages
-    messages_match = re.search(r"\*\*Messages to team\*\*:\s*\n(.*?)(?:\n\*\*|\Z)", team_section, re.DOTALL)
-    if messages_match:
-        for line in messages_match.group(1).strip().split("\n"):
+    if "Messages to team" in fields:
+        for line in fields["Messages to team"].strip().split("\n"):
             line = line.strip().lstrip("- ")
-            msg_match = re.match(r"@(\S+):\s*(.+)", line)
+            msg_match = _TEAM_MSG_LINE_RE.match(line)
             if msg_match:
                 result["messages"].append({
                     "to": msg_match.group(1),
@@ -727,20 +1015,12 @@ def parse_team_agent_output(output: str) -> dict:
                 })
 
     # Parse decisions
-    decisions_match = re.search(r"\*\*Decisions made\*\*:\s*\n(.*?)(?:\n\*\*|\Z)", team_section, re.DOTALL)
-    if decisions_match:
-        for line in decisions_match.group(1).strip().split("\n"):
-            line = line.strip().lstrip("- ")
-            if line:
-                result["decisions"].append(line)
+    if "Decisions made" in fields:
+        result["decisions"].extend(filter(None, _TEAM_LIST_ITEM_RE.findall(fields["Decisions made"].strip())))
 
     # Parse blocked dependencies
-    blocked_match = re.search(r"\*\*Blocked on\*\*:\s*\n(.*?)(?:\n\*\*|\Z)", team_section, re.DOTALL)
-    if blocked_match:
-        for line in blocked_match.group(1).strip().split("\n"):
-            line = line.strip().lstrip("- ")
-            if line:
-                result["blocked_on"].append(line)
+    if "Blocked on" in fields:
+        result["blocked_on"].extend(filter(None, _TEAM_LIST_ITEM_RE.findall(fields["Blocked on"].strip())))
 
     return result
 
@@ -780,9 +1060,9 @@ def process_team_output(root: Path, team_id: str, agent_role: str, output: str):
     # Send messages
     if parsed["messages"]:
         msg_dir = root / ".cto" / "teams" / "messages" / team_id
-        msg_dir.mkdir(parents=True, exist_ok=True)
-        existing = list(msg_dir.glob("msg-*.json"))
-        msg_num = len(existing) + 1
+        _ensure_dir(msg_dir)
+        from team import reserve_message_numbers
+        msg_num = reserve_message_numbers(msg_dir, len(parsed["messages"]))
 
         for msg in parsed["messages"]:
             msg_data = {
@@ -828,39 +1108,88 @@ def process_team_output(root: Path, team_id: str, agent_role: str, output: str):
             })
 
         ctx["updated_at"] = now_iso()
+        from team import archive_context_overflow
+        archive_context_overflow(ctx_fp.parent, team_id, ctx)
         save_json(ctx_fp, ctx)
 
     return parsed
 
 
+# Keyword → role routing table for the _keyword_select_agent() fallback.
+_ROLE_KEYWORDS: dict[str, list[str]] = {
+    "architect-morty": ["architecture", "design", "adr", "interface", "schema", "data model", "api design", "system design"],
+    "frontend-morty": ["ui", "frontend", "component", "react", "vue", "css", "html", "layout", "responsive", "ux"],
+    "backend-morty": ["api", "backend", "endpoint", "database", "server", "migration", "model", "query", "rest", "graphql"],
+    "tester-morty": ["test", "e2e", "integration test", "unit test", "qa", "regression", "coverage"],
+    "security-morty": ["security", "auth", "owasp", "vulnerability", "penetration", "encryption", "xss", "csrf", "injection"],
+    "devops-morty": ["ci/cd", "docker", "deploy", "pipeline", "kubernetes", "monitoring", "infra", "terraform"],
+}
+_ALL_KEYWORDS = sorted({kw for kws in _ROLE_KEYWORDS.values() for kw in kws}, key=len, reverse=True)
+# keyword -> roles it scores for, so scoring walks only the keywords that hit.
+_KEYWORD_ROLES: dict[str, tuple[str, ...]] = {
+    kw: tuple(role for role, kws in _ROLE_KEYWORDS.items() if kw in kws) for kw in _ALL_KEYWORDS
+}
+
+# Single-pass keyword scan: an Aho–Corasick automaton when pyahocorasick is
+# installed, otherwise one compiled alternation. The regex is a zero-width
+# lookahead so it reports a hit at every offset (like substring search), and
+# longest-first ordering means the match at an offset is the longest keyword
+# there — every shorter keyword matching at that offset is one of its
+# prefixes, recovered via _KEYWORD_PREFIXES.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _ALL_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_kw, _kw)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, _ALL_KEYWORDS)) + "))")
+_KEYWORD_PREFIXES: dict[str, tuple[str, ...]] = {
+    kw: tuple(k for k in _ALL_KEYWORDS if kw.startswith(k)) for kw in _ALL_KEYWORDS
+}
+
+
+def _matched_keywords(text: str) -> set[str]:
+    """Return every routing keyword that occurs in *text* (one scan)."""
+    if _KEYWORD_AUTOMATON is not None:
+        return {kw for _, kw in _KEYWORD_AUTOMATON.iter(text)}
+    hits: set[str] = set()
+    for m in _KEYWORD_RE.finditer(text):
+        hits.update(_KEYWORD_PREFIXES[m.group(1)])
+    return hits
+
+
+# Ticket types that decide the role outright (ticket.py --type choices);
+# checked before any text is lowercased or scanned.
+_TYPE_TO_AGENT = {
+    "epic": "architect-morty",
+    "spike": "architect-morty",
+    "security": "security-morty",
+}
+
+
 def _keyword_select_agent(ticket: dict) -> str:
     """Fallback: select agent role based on keyword matching."""
-    ttype = ticket.get("type", "")
+    by_type = _TYPE_TO_AGENT.get(ticket.get("type", ""))
+    if by_type:
+        return by_type
+
     title = (ticket.get("title") or "").lower()
     desc = (ticket.get("description") or "").lower()
     combined = f"{title} {desc}"
 
-    if ttype == "epic" or ttype == "spike":
-        return "architect-morty"
-
-    keywords_map = {
-        "architect-morty": ["architecture", "design", "adr", "interface", "schema", "data model", "api design", "system design"],
-        "frontend-morty": ["ui", "frontend", "component", "react", "vue", "css", "html", "layout", "responsive", "ux"],
-        "backend-morty": ["api", "backend", "endpoint", "database", "server", "migration", "model", "query", "rest", "graphql"],
-        "tester-morty": ["test", "e2e", "integration test", "unit test", "qa", "regression", "coverage"],
-        "security-morty": ["security", "auth", "owasp", "vulnerability", "penetration", "encryption", "xss", "csrf", "injection"],
-        "devops-morty": ["ci/cd", "docker", "deploy", "pipeline", "kubernetes", "monitoring", "infra", "terraform"],
-    }
-
-    scores: dict[str, int] = {}
-    for role, kws in keywords_map.items():
-        for kw in kws:
-            if kw in combined:
-                scores[role] = scores.get(role, 0) + 1
+    # Seeded in table order so most_common() breaks ties exactly as before;
+    # update() counts the hits in C.
+    scores = Counter(dict.fromkeys(_ROLE_KEYWORDS, 0))
+    scores.update(role for kw in _matched_keywords(combined) for role in _KEYWORD_ROLES[kw])
 
-    if scores:
-        return max(scores, key=lambda k: scores[k])
-    return "fullstack-morty"
+    best, n = scores.most_common(1)[0]
+    return best if n else "fullstack-morty"
 
 
 def smart_select_agent(ticket: dict, root: Optional[Path] = None) -> tuple:
@@ -874,7 +1203,8 @@ def smart_select_agent(ticket: dict, root: Optional[Path] = None) -> tuple:
     way there's no safe structured answer to act on, so the keyword heuristic
     is the only sane floor.
     """
-    fallback_agent = _keyword_select_agent(ticket)
+    # The keyword scan only runs on the fallback paths, not ahead of a
+    # routing reply that makes it moot.
     fallback_complexity = ticket.get("estimated_complexity", "M")
 
     title = (ticket.get("title") or "").strip()
@@ -896,7 +1226,7 @@ def smart_select_agent(ticket: dict, root: Optional[Path] = None) -> tuple:
     data = _call_helper_json(routing_prompt)
     if data is None:
         # Transport error — no parseable reply at all.
-        return fallback_agent, fallback_complexity
+        return _keyword_select_agent(ticket), fallback_complexity
 
     is_valid, errors = validate_schema(data, ROUTING_DECISION_SCHEMA)
     if is_valid:
@@ -908,7 +1238,7 @@ def smart_select_agent(ticket: dict, root: Optional[Path] = None) -> tuple:
         f"smart_select_agent reply failed schema validation: {'; '.join(errors)[:300]}",
         severity="warning",
     )
-    return fallback_agent, fallback_complexity
+    return _keyword_select_agent(ticket), fallback_complexity
 
 
 def match_agent_cards(ticket: dict, root: Optional[Path] = None) -> str:
@@ -918,9 +1248,9 @@ def match_agent_cards(ticket: dict, root: Optional[Path] = None) -> str:
     card's capabilities against the ticket, and picks the highest scorer.
     Falls back to keyword matching if the Haiku call fails.
     """
-    ttype = ticket.get("type", "")
-    if ttype in ("epic", "spike"):
-        return "architect-morty"
+    by_type = _TYPE_TO_AGENT.get(ticket.get("type", ""))
+    if by_type:
+        return by_type
 
     # Load agent capability manifests
     if root is None:
@@ -977,9 +1307,7 @@ def match_agent_cards(ticket: dict, root: Optional[Path] = None) -> str:
 
 def _ensure_scratchpad(root: Path, agent_role: str) -> Path:
     """Return the scratchpad path for agent_role, creating it if needed."""
-    scratchpad_dir = root / ".cto" / "scratchpad"
-    scratchpad_dir.mkdir(parents=True, exist_ok=True)
-    fp = scratchpad_dir / f"{agent_role}.md"
+    fp = _ensure_dir(root / ".cto" / "scratchpad") / f"{agent_role}.md"
     if not fp.exists():
         fp.write_text(
             f"# {agent_role} scratchpad\n\n"
@@ -990,9 +1318,7 @@ def _ensure_scratchpad(root: Path, agent_role: str) -> Path:
 
 def _ensure_team_scratchpad(root: Path, team_id: str) -> Path:
     """Return the shared team scratchpad path, creating it if needed."""
-    scratchpad_dir = root / ".cto" / "scratchpad"
-    scratchpad_dir.mkdir(parents=True, exist_ok=True)
-    fp = scratchpad_dir / "team-scratchpad.md"
+    fp = _ensure_dir(root / ".cto" / "scratchpad") / "team-scratchpad.md"
     if not fp.exists():
         fp.write_text(
             "# Team scratchpad\n\n"
@@ -1042,9 +1368,7 @@ MEMORY_LOAD_ENTRIES = 10
 
 def _memory_dir(root: Path) -> Path:
     """Return the .cto/memory/ directory, creating it if needed."""
-    d = root / ".cto" / "memory"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _ensure_dir(root / ".cto" / "memory")
 
 
 def _memory_file(root: Path, agent_role: str) -> Path:
@@ -1064,7 +1388,7 @@ def _load_agent_memory(root: Path, agent_role: str) -> list[dict]:
                 line = line.strip()
                 if line:
                     try:
-                        entries.append(json.loads(line))
+                        entries.append(_json_loads(line))
                     except json.JSONDecodeError:
                         pass
     except Exception:
@@ -1083,7 +1407,7 @@ def _save_agent_memory(root: Path, agent_role: str, entry: dict):
                     line = line.strip()
                     if line:
                         try:
-                            entries.append(json.loads(line))
+                            entries.append(_json_loads(line))
                         except json.JSONDecodeError:
                             pass
         except Exception:
@@ -1093,7 +1417,7 @@ def _save_agent_memory(root: Path, agent_role: str, entry: dict):
         entries = entries[-MEMORY_MAX_ENTRIES:]
     with open(fp, "w") as f:
         for e in entries:
-            f.write(json.dumps(e) + "\n")
+            f.write(_json_dumps(e) + "\n")
 
 
 def _extract_memory_entry(ticket_id: str, agent_role: str, output: str) -> Optional[dict]:
@@ -1355,11 +1679,19 @@ def _resolve_model_for_cli(model: str) -> str:
     return model
 
 
-def _check_claude_effort_support() -> bool:
-    """Return True if the installed claude CLI supports --effort."""
-    global _claude_effort_supported
-    if _claude_effort_supported is not None:
-        return _claude_effort_supported
+_claude_help_output: Optional[str] = None
+
+
+def _claude_help_text() -> str:
+    """Return `claude --help` output, spawning the CLI at most once per process.
+
+    Every capability probe below reads this shared text instead of forking
+    its own `claude --help` (previously up to four CLI start-ups before the
+    first delegation).
+    """
+    global _claude_help_output
+    if _claude_help_output is not None:
+        return _claude_help_output
     try:
         result = subprocess.run(
             ["claude", "--help"],
@@ -1367,45 +1699,33 @@ def _check_claude_effort_support() -> bool:
             text=True,
             timeout=5,
         )
-        _claude_effort_supported = "--effort" in (result.stdout + result.stderr)
+        _claude_help_output = result.stdout + result.stderr
     except Exception:
-        _claude_effort_supported = False
+        _claude_help_output = ""
+    return _claude_help_output
+
+
+def _check_claude_effort_support() -> bool:
+    """Return True if the installed claude CLI supports --effort."""
+    global _claude_effort_supported
+    if _claude_effort_supported is None:
+        _claude_effort_supported = "--effort" in _claude_help_text()
     return _claude_effort_supported
 
 
 def _check_claude_thinking_support() -> bool:
     """Return True if the installed claude CLI supports --thinking."""
     global _claude_thinking_supported
-    if _claude_thinking_supported is not None:
-        return _claude_thinking_supported
-    try:
-        result = subprocess.run(
-            ["claude", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        _claude_thinking_supported = "--thinking" in (result.stdout + result.stderr)
-    except Exception:
-        _claude_thinking_supported = False
+    if _claude_thinking_supported is None:
+        _claude_thinking_supported = "--thinking" in _claude_help_text()
     return _claude_thinking_supported
 
 
 def _check_claude_output_format_json_support() -> bool:
     """Return True if the installed claude CLI supports --output-format json."""
     global _claude_output_format_json_supported
-    if _claude_output_format_json_supported is not None:
-        return _claude_output_format_json_supported
-    try:
-        result = subprocess.run(
-            ["claude", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        _claude_output_format_json_supported = "--output-format" in (result.stdout + result.stderr)
-    except Exception:
-        _claude_output_format_json_supported = False
+    if _claude_output_format_json_supported is None:
+        _claude_output_format_json_supported = "--output-format" in _claude_help_text()
     return _claude_output_format_json_supported
 
 
@@ -1422,18 +1742,8 @@ _claude_agent_flag_supported: Optional[bool] = None
 def _check_claude_agent_flag_support() -> bool:
     """Return True if the installed claude CLI supports --agent <name>."""
     global _claude_agent_flag_supported
-    if _claude_agent_flag_supported is not None:
-        return _claude_agent_flag_supported
-    try:
-        result = subprocess.run(
-            ["claude", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        _claude_agent_flag_supported = "--agent <agent>" in (result.stdout + result.stderr)
-    except Exception:
-        _claude_agent_flag_supported = False
+    if _claude_agent_flag_supported is None:
+        _claude_agent_flag_supported = "--agent <agent>" in _claude_help_text()
     return _claude_agent_flag_supported
 
 
@@ -1460,6 +1770,14 @@ def use_native_subagent(root: Path, agent_role: str) -> bool:
     return _check_claude_agent_flag_support()
 
 
+# Agent-output extraction patterns, compiled once at import rather than
+# looked up in re's pattern cache on every parse.
+_RESULT_JSON_RE = re.compile(r"<result_json>\s*(.*?)\s*</result_json>", re.DOTALL)
+_FENCED_JSON_RE = re.compile(r"```json\s*\n(.*?)\n```", re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_THINKING_BLOCK_RE = re.compile(r"<thinking>(.*?)</thinking>", re.DOTALL)
+
+
 def _call_helper_json(prompt: str, model: str = "claude-haiku-4-5-20251001", timeout: int = 30) -> Optional[dict]:
     """Call a Haiku helper subprocess and return the parsed JSON response.
 
@@ -1476,32 +1794,32 @@ def _call_helper_json(prompt: str, model: str = "claude-haiku-4-5-20251001", tim
     def _run() -> str:
         if _check_claude_output_format_json_support():
             r = subprocess.run(
-                ["claude", "-p", "--model", resolved_model, "--output-format", "json", full_prompt],
-                capture_output=True, text=True, timeout=timeout, env=env,
+                ["claude", "-p", "--model", resolved_model, "--output-format", "json"],
+                input=full_prompt, capture_output=True, text=True, timeout=timeout, env=env,
             )
             try:
-                outer = json.loads(r.stdout.strip())
+                outer = _json_loads(r.stdout.strip())
                 return outer.get("result", r.stdout.strip())
             except json.JSONDecodeError:
                 return r.stdout.strip()
         else:
             r = subprocess.run(
-                ["claude", "-p", "--model", resolved_model, full_prompt],
-                capture_output=True, text=True, timeout=timeout, env=env,
+                ["claude", "-p", "--model", resolved_model],
+                input=full_prompt, capture_output=True, text=True, timeout=timeout, env=env,
             )
             return r.stdout.strip()
 
     def _parse(raw: str) -> Optional[dict]:
         try:
-            data = json.loads(raw)
+            data = _json_loads(raw)
             if isinstance(data, dict):
                 return data
         except json.JSONDecodeError:
             pass
-        m = re.search(r'\{.*\}', raw, re.DOTALL)
+        m = _JSON_OBJECT_RE.search(raw)
         if m:
             try:
-                data = json.loads(m.group())
+                data = _json_loads(m.group())
                 if isinstance(data, dict):
                     return data
             except json.JSONDecodeError:
@@ -1563,7 +1881,7 @@ def _select_fewshot_examples(root: Path, agent_role: str, ticket: dict) -> list[
     if mem_fp.exists():
         try:
             with open(mem_fp) as f:
-                mem_lines = [json.loads(l) for l in f if l.strip()]
+                mem_lines = [_json_loads(l) for l in f if l.strip()]
         except Exception:
             mem_lines = []
         for entry in mem_lines:
@@ -1634,57 +1952,8 @@ def _render_fewshot_examples(examples: list[dict]) -> str:
     return "\n".join(blocks)
 
 
-def build_prompt(root: Path, ticket: dict, agent_role: str, team_id: Optional[str] = None, task_budget: Optional[int] = None) -> str:
-    """Assemble the full prompt for the sub-agent.
-
-    The prompt is split into a STABLE PREFIX (persona, role rules, and the
-    full effort-guidance table — byte-identical for every ticket this role
-    picks up in a sprint) followed by a VOLATILE SUFFIX (ticket body, file
-    context, sprint/memory state). The stable content is assembled first so
-    Anthropic's prompt cache can reuse it across delegations instead of
-    re-writing it every 5 minutes — see persona.PROMPT_CACHE_TTL.
-
-    Context is kept minimal here — agents pull ADRs, related ticket details,
-    and team state on-demand via MCP tools (get_ticket, get_team_context,
-    read_adr, reserve_files, send_team_message) instead of bloating the prompt.
-
-    Args:
-        root: Project root path
-        ticket: Ticket dict
-        agent_role: Role of the agent
-        team_id: Optional team session ID for team collaboration context
-        task_budget: Optional advisory token budget (Opus 4.7 task_budget feature)
-    """
-    card = load_agent_card(agent_role, root=root) or load_agent_card("fullstack-morty", root=root)
-    role_prompt = _build_agent_prompt(
-        card.get("name", agent_role),
-        card.get("identity", ""),
-        card.get("specialization", ""),
-        card.get("extra_constraints", ""),
-        rubric=ROLE_RUBRICS.get(agent_role, ""),
-    )
-    allowed_tools = card.get("allowed_tools", ["Read", "Write", "Edit", "Bash", "Grep", "Glob"])
-    allowed_tools_block = (
-        f"<available_tools>\n"
-        f"You have permission to use these tools: {', '.join(allowed_tools)}. "
-        f"Do not attempt tools outside this list.\n"
-        f"</available_tools>\n"
-    )
-
-    # ── STABLE PREFIX ────────────────────────────────────────────────────
-    # role_prompt, allowed_tools_block, and the effort-guidance table are
-    # identical for every ticket this role runs this sprint (the agent card,
-    # rubric, and guidance tables don't change mid-sprint), so they're
-    # assembled first, unmodified, ahead of any per-ticket content below.
-    # The `claude -p` CLI path has no cache_control hook, so consistent
-    # prefix ordering is the only lever available here; a direct Anthropic
-    # SDK call would additionally attach persona.prefix_cache_control()
-    # (ttl="1h") to this prefix's last content block.
-    stable_prefix = f"""{role_prompt}
-
-{allowed_tools_block}{build_effort_guidance_block()}
-"""
-    stable_prefix += """
+# Role-independent protocol/output-format block that closes the stable prefix.
+_PROMPT_PROTOCOL_BLOCK = """
 <reasoning_protocol>
 Use your internal thinking to reason deeply, then show a brief summary of your approach before executing.
 
@@ -1756,6 +2025,147 @@ As a backup, also emit a `## Files changed` markdown block listing every file yo
 </output_format>
 """
 
+# Static few-shot pair used when no similar completed ticket is available.
+_STATIC_FEWSHOT_EXAMPLES = """<examples>
+<example>
+ANALYZE: Ticket asks to add a `created_at` timestamp field to the User model. The model lives in `models/user.py` and the DB migration folder is `migrations/`.
+PLAN:
+- Add `created_at = Column(DateTime, default=datetime.utcnow)` to `User` in `models/user.py`
+- Generate migration with `alembic revision --autogenerate -m "add_user_created_at"`
+- Verify migration SQL matches expected schema change
+VERIFY: Acceptance criteria require the field to be non-nullable with a server default — covered.
+EXECUTE: Applied changes to model and generated migration file.
+
+<result_json>
+{
+  "status": "completed",
+  "files_changed": ["models/user.py", "migrations/versions/0042_add_user_created_at.py"],
+  "description": "Added created_at DateTime column to User model with utcnow default and generated the corresponding Alembic migration.",
+  "open_questions": null,
+  "confidence": "high",
+  "next_steps": []
+}
+</result_json>
+</example>
+<example>
+ANALYZE: Ticket asks to extract a `format_currency` helper from three duplicated call sites in `utils/billing.py`, `utils/invoice.py`, and `api/checkout.py`.
+PLAN:
+- Create `utils/formatting.py` with `format_currency(amount, currency="EUR")` function
+- Replace the three inline snippets with imports of the new helper
+VERIFY: All three sites use the same rounding logic — safe to unify.
+EXECUTE: Created helper module and updated all three call sites.
+
+<result_json>
+{
+  "status": "completed",
+  "files_changed": ["utils/formatting.py", "utils/billing.py", "utils/invoice.py", "api/checkout.py"],
+  "description": "Extracted duplicated currency-formatting logic into utils/formatting.py and replaced three call sites with imports.",
+  "open_questions": null,
+  "confidence": "high",
+  "next_steps": []
+}
+</result_json>
+</example>
+</examples>
+"""
+
+# Invariant pieces of the per-ticket mission block. build_prompt appends
+# these module-level strings to its parts list as-is, so only the
+# genuinely per-ticket values are formatted into new strings each call.
+_MCP_TOOLS_ADRS = """### Context available via MCP tools
+You have MCP tools to pull context on-demand — use them instead of guessing:
+- **read_adr(name)** — Read an Architecture Decision Record. Pass `*` to list all.
+  Available ADRs: """
+_MCP_TOOLS_TICKETS = """
+- **get_ticket(ticket_id)** — Read full ticket data including agent output and dependencies.
+  Related ticket IDs: """
+_MCP_TOOLS_TEAM = """
+- **get_team_context(team_id)** — Read shared team decisions, interfaces, and messages."""
+_MCP_TOOLS_TAIL = """
+- **reserve_files(team_id, files)** — Reserve files before modifying to prevent teammate conflicts.
+- **send_team_message(team_id, to, message, msg_type)** — Send a message to a teammate.
+- **update_ticket_status(ticket_id, status, output)** — Report interim progress to Rick.
+"""
+_TEAM_DELEGATION_NOTE = (
+    "\n\n**TEAM MODE — DELEGATION REQUIRED**: You MUST delegate subtasks to teammates "
+    "via send_team_message — do NOT attempt to complete all work yourself. "
+    "Spawn teammate work explicitly for every subtask that falls outside your specialty. "
+    "Doing everything yourself when teammates are available is Jerry behavior."
+)
+
+_PROMPT_CLOSING = """
+---
+Now execute the ticket. After completing all work, your FINAL output must be the JSON report block — no text after it.
+
+Begin:
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _stable_prompt_prefix(root: Path, agent_role: str) -> str:
+    """Render the cacheable stable prefix of an agent prompt for *agent_role*.
+
+    role_prompt, the allowed-tools block, and the effort-guidance table are
+    identical for every ticket this role runs this sprint (the agent card,
+    rubric, and guidance tables don't change mid-sprint), so they're
+    assembled first, unmodified, ahead of any per-ticket content. The
+    `claude -p` CLI path has no cache_control hook, so consistent prefix
+    ordering is the only lever available here; a direct Anthropic SDK call
+    would additionally attach persona.prefix_cache_control() (ttl="1h") to
+    this prefix's last content block.
+
+    Memoized so back-to-back delegations (handoffs, reflection retries, team
+    members in one process) skip reloading the agent card and re-rendering.
+    """
+    card = load_agent_card(agent_role, root=root) or load_agent_card("fullstack-morty", root=root)
+    role_prompt = _build_agent_prompt(
+        card.get("name", agent_role),
+        card.get("identity", ""),
+        card.get("specialization", ""),
+        card.get("extra_constraints", ""),
+        rubric=ROLE_RUBRICS.get(agent_role, ""),
+    )
+    allowed_tools = card.get("allowed_tools", ["Read", "Write", "Edit", "Bash", "Grep", "Glob"])
+    allowed_tools_block = (
+        f"<available_tools>\n"
+        f"You have permission to use these tools: {', '.join(allowed_tools)}. "
+        f"Do not attempt tools outside this list.\n"
+        f"</available_tools>\n"
+    )
+    return f"""{role_prompt}
+
+{allowed_tools_block}{build_effort_guidance_block()}
+""" + _PROMPT_PROTOCOL_BLOCK
+
+
+def build_prompt(root: Path, ticket: dict, agent_role: str, team_id: Optional[str] = None, task_budget: Optional[int] = None,
+                 use_cache: bool = True) -> str:
+    """Assemble the full prompt for the sub-agent.
+
+    The prompt is split into a STABLE PREFIX (persona, role rules, and the
+    full effort-guidance table — byte-identical for every ticket this role
+    picks up in a sprint) followed by a VOLATILE SUFFIX (ticket body, file
+    context, sprint/memory state). The stable content is assembled first so
+    Anthropic's prompt cache can reuse it across delegations instead of
+    re-writing it every 5 minutes — see persona.PROMPT_CACHE_TTL.
+
+    Context is kept minimal here — agents pull ADRs, related ticket details,
+    and team state on-demand via MCP tools (get_ticket, get_team_context,
+    read_adr, reserve_files, send_team_message) instead of bloating the prompt.
+
+    Args:
+        root: Project root path
+        ticket: Ticket dict
+        agent_role: Role of the agent
+        team_id: Optional team session ID for team collaboration context
+        task_budget: Optional advisory token budget (Opus 4.7 task_budget feature)
+        use_cache: Reuse the on-disk project-structure cache (False for --no-cache)
+    """
+    # ── STABLE PREFIX ────────────────────────────────────────────────────
+    # Rendered once per (root, role) by _stable_prompt_prefix() and reused
+    # for every later ticket this role picks up in the same process.
+    stable_prefix = _stable_prompt_prefix(root, agent_role)
+
     # ── VOLATILE SUFFIX ──────────────────────────────────────────────────
     # Everything below is per-ticket: budget, file scope, ticket body,
     # sprint/memory state, and few-shot examples. None of it is assumed
@@ -1775,7 +2185,7 @@ As a backup, also emit a `## Files changed` markdown block listing every file yo
 
     review_issues = ticket.get("review_issues") or []
     if review_issues:
-        issues_text = "\n".join(f"- {i}" for i in review_issues)
+        issues_text = "\n".join([f"- {i}" for i in review_issues])
         safe_review_feedback = wrap_untrusted_content(issues_text, label="REVIEWER_FEEDBACK")
         review_feedback_block = (
             f"<reviewer_feedback>\n"
@@ -1788,8 +2198,8 @@ As a backup, also emit a `## Files changed` markdown block listing every file yo
         review_feedback_block = ""
 
     criteria = ticket.get("acceptance_criteria") or []
-    criteria_text = "\n".join(f"- {c}" for c in criteria) if criteria else "(none specified)"
-    structure = get_project_structure(root)
+    criteria_text = "\n".join([f"- {c}" for c in criteria]) if criteria else "(none specified)"
+    structure = get_project_structure(root, use_cache=use_cache)
 
     # Scan ticket description for secrets before sending to Claude
     raw_description = ticket.get('description') or '(no description)'
@@ -1809,19 +2219,13 @@ As a backup, also emit a `## Files changed` markdown block listing every file yo
     related_summary = ", ".join(related_ids) if related_ids else "(none)"
 
     # List available ADR names — full content available via read_adr MCP tool
-    dd = root / ".cto" / "decisions"
-    adr_names = [fp.stem for fp in sorted(dd.glob("*.md"))] if dd.exists() else []
+    adr_names = _adr_names(root)
     adr_list = ", ".join(adr_names) if adr_names else "(none)"
 
     team_delegation_note = ""
     contract_note = ""
     if team_id:
-        team_delegation_note = (
-            "\n\n**TEAM MODE — DELEGATION REQUIRED**: You MUST delegate subtasks to teammates "
-            "via send_team_message — do NOT attempt to complete all work yourself. "
-            "Spawn teammate work explicitly for every subtask that falls outside your specialty. "
-            "Doing everything yourself when teammates are available is Jerry behavior."
-        )
+        team_delegation_note = _TEAM_DELEGATION_NOTE
         contract_fp = _team_contract_path(root, team_id)
         if _team_contract_exists(root, team_id):
             contract_note = (
@@ -1842,7 +2246,9 @@ As a backup, also emit a `## Files changed` markdown block listing every file yo
             f"finish gracefully as the budget approaches exhaustion.\n\n"
         )
 
-    volatile_suffix = f"""{budget_section}{task_boundaries_block}{review_feedback_block}
+    # Accumulate the suffix as parts and join once at the end rather than
+    # re-copying the growing multi-KB string on every +=.
+    parts = [stable_prefix, f"""{budget_section}{task_boundaries_block}{review_feedback_block}
 ## Your Mission, Morty
 
 **Ticket {ticket['id']}**: {ticket['title']}
@@ -1859,24 +2265,18 @@ As a backup, also emit a `## Files changed` markdown block listing every file yo
 - Project structure:
 {structure}
 
-### Context available via MCP tools
-You have MCP tools to pull context on-demand — use them instead of guessing:
-- **read_adr(name)** — Read an Architecture Decision Record. Pass `*` to list all.
-  Available ADRs: {adr_list}
-- **get_ticket(ticket_id)** — Read full ticket data including agent output and dependencies.
-  Related ticket IDs: {related_summary}
-- **get_team_context(team_id)** — Read shared team decisions, interfaces, and messages.{f" Your team_id: {team_id}" if team_id else " (solo delegation — no team)"}
-- **reserve_files(team_id, files)** — Reserve files before modifying to prevent teammate conflicts.
-- **send_team_message(team_id, to, message, msg_type)** — Send a message to a teammate.
-- **update_ticket_status(ticket_id, status, output)** — Report interim progress to Rick.
-{team_delegation_note}{contract_note}"""
+""",
+             _MCP_TOOLS_ADRS, adr_list,
+             _MCP_TOOLS_TICKETS, related_summary,
+             _MCP_TOOLS_TEAM, f" Your team_id: {team_id}" if team_id else " (solo delegation — no team)",
+             _MCP_TOOLS_TAIL, team_delegation_note, contract_note]
 
     # Inject sprint context for downstream agents (PROM-008).
     # Sprint context embeds previous agent output descriptions that may have processed
     # repo files — route through wrap_untrusted_content to spotlight indirect injection.
     sprint_ctx = _load_sprint_context(root)
     if sprint_ctx:
-        volatile_suffix += f"\n{wrap_untrusted_content(sprint_ctx, label='REPO_CONTENT')}\n"
+        parts.append(f"\n{wrap_untrusted_content(sprint_ctx, label='REPO_CONTENT')}\n")
 
     # Inject per-role agent memory (accumulated lessons from past tickets)
     memory_entries = _load_agent_memory(root, agent_role)
@@ -1889,23 +2289,23 @@ You have MCP tools to pull context on-demand — use them instead of guessing:
             if patterns:
                 memory_lines.append(f"- [{ts} {tid}]: " + "; ".join(patterns))
         if memory_lines:
-            volatile_suffix += (
+            parts.extend((
                 "\n<agent_memory>\n"
                 "Lessons you've learned from past tickets in this project "
-                "(apply these patterns now):\n"
-                + "\n".join(memory_lines)
-                + "\n</agent_memory>\n"
-            )
+                "(apply these patterns now):\n",
+                "\n".join(memory_lines),
+                "\n</agent_memory>\n",
+            ))
 
     # Inject persistent scratchpad / memory section
     memory_section = _build_memory_section(root, agent_role, team_id=team_id)
-    volatile_suffix += f"\n{memory_section}\n"
+    parts.append(f"\n{memory_section}\n")
 
     # Point at the complexity tier for this ticket — the full guidance text for
     # every tier already lives in the stable prefix's effort_guidance_reference.
     ticket_complexity = ticket.get("estimated_complexity", "").upper()
     if ticket_complexity in COMPLEXITY_GUIDANCE:
-        volatile_suffix += (
+        parts.append(
             f"\n<complexity_guidance>\n"
             f"Current ticket complexity: {ticket_complexity}. "
             f"See <effort_guidance_reference> above for the full per-tier breakdown.\n"
@@ -1915,58 +2315,14 @@ You have MCP tools to pull context on-demand — use them instead of guessing:
     # Select few-shot examples: prefer similar completed tickets, fall back to static pair
     dynamic_examples = _select_fewshot_examples(root, agent_role, ticket)
     if dynamic_examples:
-        volatile_suffix += "<examples>\n" + _render_fewshot_examples(dynamic_examples) + "\n</examples>\n"
+        parts.extend(("<examples>\n", _render_fewshot_examples(dynamic_examples), "\n</examples>\n"))
     else:
-        volatile_suffix += """<examples>
-<example>
-ANALYZE: Ticket asks to add a `created_at` timestamp field to the User model. The model lives in `models/user.py` and the DB migration folder is `migrations/`.
-PLAN:
-- Add `created_at = Column(DateTime, default=datetime.utcnow)` to `User` in `models/user.py`
-- Generate migration with `alembic revision --autogenerate -m "add_user_created_at"`
-- Verify migration SQL matches expected schema change
-VERIFY: Acceptance criteria require the field to be non-nullable with a server default — covered.
-EXECUTE: Applied changes to model and generated migration file.
+        parts.append(_STATIC_FEWSHOT_EXAMPLES)
 
-<result_json>
-{
-  "status": "completed",
-  "files_changed": ["models/user.py", "migrations/versions/0042_add_user_created_at.py"],
-  "description": "Added created_at DateTime column to User model with utcnow default and generated the corresponding Alembic migration.",
-  "open_questions": null,
-  "confidence": "high",
-  "next_steps": []
-}
-</result_json>
-</example>
-<example>
-ANALYZE: Ticket asks to extract a `format_currency` helper from three duplicated call sites in `utils/billing.py`, `utils/invoice.py`, and `api/checkout.py`.
-PLAN:
-- Create `utils/formatting.py` with `format_currency(amount, currency="EUR")` function
-- Replace the three inline snippets with imports of the new helper
-VERIFY: All three sites use the same rounding logic — safe to unify.
-EXECUTE: Created helper module and updated all three call sites.
-
-<result_json>
-{
-  "status": "completed",
-  "files_changed": ["utils/formatting.py", "utils/billing.py", "utils/invoice.py", "api/checkout.py"],
-  "description": "Extracted duplicated currency-formatting logic into utils/formatting.py and replaced three call sites with imports.",
-  "open_questions": null,
-  "confidence": "high",
-  "next_steps": []
-}
-</result_json>
-</example>
-</examples>
-"""
+    parts.append(_PROMPT_CLOSING)
+    return "".join(parts)
 
-    volatile_suffix += """
----
-Now execute the ticket. After completing all work, your FINAL output must be the JSON report block — no text after it.
 
-Begin:
-"""
-    return stable_prefix + volatile_suffix
 
 
 def _reformat_retry_haiku(output: str) -> Optional[dict]:
@@ -1988,16 +2344,17 @@ def _reformat_retry_haiku(output: str) -> Optional[dict]:
     )
     try:
         result = subprocess.run(
-            ["claude", "-p", "--model", "claude-haiku-4-5-20251001", prompt],
+            ["claude", "-p", "--model", "claude-haiku-4-5-20251001"],
+            input=prompt,
             capture_output=True,
             text=True,
             timeout=60,
             env=_clean_subprocess_env(),
         )
         raw = result.stdout.strip()
-        match = re.search(r"<result_json>\s*(.*?)\s*</result_json>", raw, re.DOTALL)
+        match = _RESULT_JSON_RE.search(raw)
         if match:
-            data = json.loads(match.group(1))
+            data = _json_loads(match.group(1))
             if isinstance(data, dict) and "status" in data:
                 audit_log_security_event(
                     "reformat_retry_success",
@@ -2023,23 +2380,35 @@ def _parse_handoff_from_output(output: str):
         return None
 
 
+def _last_json_block(output: str, marker: str, pattern: re.Pattern) -> Optional[dict]:
+    """Parse the last *pattern* block in *output* that holds valid JSON.
+
+    Walks the block markers backwards with rfind and anchors the pattern at
+    each one, so the usual case — one report block at the end of a long
+    transcript — costs a single reverse substring scan and one anchored
+    match instead of a regex pass over the whole output.
+    """
+    end = len(output)
+    while True:
+        pos = output.rfind(marker, 0, end)
+        if pos < 0:
+            return None
+        m = pattern.match(output, pos)
+        if m:
+            try:
+                return _json_loads(m.group(1))
+            except json.JSONDecodeError:
+                pass
+        end = pos
+
+
 def _extract_json_from_output(output: str) -> Optional[dict]:
     """Extract JSON from <result_json> XML tags or ```json fenced code blocks."""
-    # Try XML-tagged form first (unambiguous delimiter)
-    xml_matches = list(re.finditer(r'<result_json>\s*(.*?)\s*</result_json>', output, re.DOTALL))
-    for m in reversed(xml_matches):
-        try:
-            return json.loads(m.group(1))
-        except json.JSONDecodeError:
-            continue
-    # Fall back to fenced JSON blocks
-    matches = list(re.finditer(r'```json\s*\n(.*?)\n```', output, re.DOTALL))
-    for m in reversed(matches):
-        try:
-            return json.loads(m.group(1))
-        except json.JSONDecodeError:
-            continue
-    return None
+    # Try XML-tagged form first (unambiguous delimiter), then fenced JSON blocks
+    data = _last_json_block(output, "<result_json>", _RESULT_JSON_RE)
+    if data is None:
+        data = _last_json_block(output, "```json", _FENCED_JSON_RE)
+    return data
 
 
 def parse_agent_output(output: str) -> dict:
@@ -2175,7 +2544,7 @@ def reflect_on_output(output: str, criteria: list, ticket_id: str = "") -> dict:
     if not criteria:
         return {"criteria_met": [], "criteria_missed": [], "pass": True}
 
-    criteria_text = "\n".join(f"- {c}" for c in criteria)
+    criteria_text = "\n".join([f"- {c}" for c in criteria])
     # Use last 4000 chars of output to stay within Haiku's sweet spot
     safe_output = (output or "")[-4000:]
 
@@ -2291,7 +2660,7 @@ def review_ticket(root: Path, ticket: dict, handoff: dict, model: str = "sonnet"
         return {"approved": True, "issues": []}
 
     files_changed = handoff.get("files_changed") or []
-    criteria_text = "\n".join(f"- {c}" for c in criteria)
+    criteria_text = "\n".join([f"- {c}" for c in criteria])
     diff = _collect_review_diff(root, files_changed)
     diff_block = diff if diff else "(no git diff available — review the description below)"
 
@@ -2350,6 +2719,66 @@ def _detect_phase(line: str) -> Optional[str]:
 _STATUS_TTY = sys.stdout.isatty()
 
 
+def _feed_stdin(proc: subprocess.Popen, data: bytes):
+    """Write *data* to the child's stdin and close it (EOF ends the prompt)."""
+    try:
+        proc.stdin.write(data)
+    except (BrokenPipeError, OSError):
+        pass  # child exited early — its exit code/stderr tell the story
+    finally:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+
+
+_STREAM_READ_CHUNK = 64 * 1024  # bytes per os.read() from the agent's pipes
+_STDERR_KEEP_BYTES = 4096       # stderr retained for failure messages
+
+
+def _iter_process_lines(proc: subprocess.Popen, timeout: float, start_time: float, stderr_buf: bytearray):
+    """Yield decoded stdout lines from *proc* as they arrive.
+
+    Reads raw chunks with select()+os.read() so the timeout is enforced even
+    while the agent is silent (a blocking readline() only noticed it after the
+    next line), and drains stderr alongside stdout so a chatty stderr can't
+    fill its pipe and wedge the child. The first _STDERR_KEEP_BYTES of stderr
+    are kept in *stderr_buf* for error reporting.
+
+    Raises:
+        subprocess.TimeoutExpired: once *timeout* seconds have passed since *start_time*
+    """
+    out_fd = proc.stdout.fileno()
+    err_fd = proc.stderr.fileno()
+    open_fds = [out_fd, err_fd]
+    pending = bytearray()
+    while open_fds:
+        remaining = start_time + timeout - time.time()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        ready, _, _ = select.select(open_fds, [], [], remaining)
+        for fd in ready:
+            chunk = os.read(fd, _STREAM_READ_CHUNK)
+            if not chunk:
+                open_fds.remove(fd)
+                continue
+            if fd == err_fd:
+                room = _STDERR_KEEP_BYTES - len(stderr_buf)
+                if room > 0:
+                    stderr_buf += chunk[:room]
+                continue
+            pending += chunk
+            while True:
+                nl = pending.find(b"\n")
+                if nl < 0:
+                    break
+                line = bytes(pending[:nl + 1])
+                del pending[:nl + 1]
+                yield line.decode("utf-8", "replace")
+    if pending:
+        yield bytes(pending).decode("utf-8", "replace")
+
+
 def _team_status_rows(
     root: Path,
     team_id: str,
@@ -2399,6 +2828,22 @@ def _render_status_rows(rows: list, prior_count: int) -> int:
     return 0
 
 
+@functools.lru_cache(maxsize=1)
+def _mcp_config_arg() -> Optional[str]:
+    """The --mcp-config JSON for the CTO MCP server, built once per process."""
+    mcp_server = Path(__file__).parent / "mcp_server.py"
+    if not mcp_server.exists():
+        return None
+    return json.dumps({
+        "mcpServers": {
+            "cto-orchestrator": {
+                "command": "python3",
+                "args": [str(mcp_server)],
+            }
+        }
+    })
+
+
 def delegate_to_agent(prompt: str, model: str = "sonnet", timeout: int = 600, skip_permissions: bool = False, thinking_budget: int = None, agent_role: str = "rick", team_id: Optional[str] = None, task_budget: Optional[int] = None, effort: Optional[str] = None, stream: bool = True, session_id: Optional[str] = None, ticket_id: Optional[str] = None, verbose: bool = False) -> str:
     """Call a claude sub-agent with a specific prompt.
 
@@ -2480,17 +2925,8 @@ def delegate_to_agent(prompt: str, model: str = "sonnet", timeout: int = 600, sk
             cmd.extend(["--allowedTools", ",".join(allowed)])
 
     # Attach MCP server so agents can query/update CTO state during execution
-    mcp_server = Path(__file__).parent / "mcp_server.py"
-    if mcp_server.exists():
-        import json as _json
-        mcp_config = _json.dumps({
-            "mcpServers": {
-                "cto-orchestrator": {
-                    "command": "python3",
-                    "args": [str(mcp_server)],
-                }
-            }
-        })
+    mcp_config = _mcp_config_arg()
+    if mcp_config:
         cmd.extend(["--mcp-config", mcp_config])
 
     if model:
@@ -2509,7 +2945,15 @@ def delegate_to_agent(prompt: str, model: str = "sonnet", timeout: int = 600, sk
             safe_prompt = f"## EFFORT LEVEL: {effort} — reason accordingly.\n\n{safe_prompt}"
     if stream:
         cmd.extend(["--output-format", "stream-json", "--verbose", "--include-partial-messages"])
-    cmd.append(safe_prompt)
+    # `claude -p` reads the prompt from stdin when no positional prompt is
+    # given — avoids copying a multi-KB prompt through argv (ARG_MAX) and
+    # keeps it out of variadic flags like --mcp-config. The --resume path
+    # isn't in print mode, so it keeps the prompt as its positional arg.
+    prompt_stdin: Optional[bytes] = None
+    if session_id:
+        cmd.append(safe_prompt)
+    else:
+        prompt_stdin = safe_prompt.encode("utf-8")
 
     # Strip auth-interfering env vars (CLAUDECODE, ANTHROPIC_API_KEY, ...) so
     # the subprocess doesn't get a "nested session" error or silently switch
@@ -2532,31 +2976,33 @@ def delegate_to_agent(prompt: str, model: str = "sonnet", timeout: int = 600, sk
     lines_since_progress = 0
     status_root = delegate_root
     status_line_count = 0
+    stderr_buf = bytearray()
 
     try:
         proc = subprocess.Popen(
             cmd,
+            stdin=subprocess.PIPE if prompt_stdin is not None else subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             cwd=os.getcwd(),
             env=env,
         )
     except Exception as e:
         raise RuntimeError(f"Failed to start agent process: {e}")
+    if prompt_stdin is not None:
+        # Feed stdin from a thread so a prompt larger than the pipe buffer
+        # can't deadlock against the stdout reader below.
+        threading.Thread(target=_feed_stdin, args=(proc, prompt_stdin), daemon=True).start()
 
     try:
-        while True:
-            line = proc.stdout.readline()
-            if not line and proc.poll() is not None:
-                break
+        for line in _iter_process_lines(proc, timeout, start_time, stderr_buf):
             if line:
                 lines_since_progress += 1
                 detected = None
 
                 if stream:
                     try:
-                        event = json.loads(line.strip())
+                        event = _json_loads(line.strip())
                         etype = event.get("type", "")
                         if etype == "assistant":
                             content = event.get("message", {}).get("content", [])
@@ -2721,7 +3167,7 @@ def delegate_to_agent(prompt: str, model: str = "sonnet", timeout: int = 600, sk
 
         proc.wait()
         if proc.returncode != 0:
-            stderr = proc.stderr.read(500) if proc.stderr else "(no stderr)"
+            stderr = bytes(stderr_buf[:500]).decode("utf-8", "replace") or "(no stderr)"
             # Surface auth source for diagnosis: ANTHROPIC_API_KEY is stripped from the
             # subprocess env (see _clean_subprocess_env), but if it's set in the parent
             # shell that's a strong hint the failure is auth-related upstream of us.
@@ -2748,7 +3194,7 @@ def delegate_to_agent(prompt: str, model: str = "sonnet", timeout: int = 600, sk
         full_output = stream_result if (stream and stream_result is not None) else "".join(output_chunks)
         # Extract and audit-log thinking blocks from any agent that ran with thinking enabled
         if thinking_budget is not None:
-            thinking_blocks = re.findall(r'<thinking>(.*?)</thinking>', full_output, re.DOTALL)
+            thinking_blocks = _THINKING_BLOCK_RE.findall(full_output)
             if thinking_blocks:
                 total_chars = sum(len(b) for b in thinking_blocks)
                 audit_log_security_event(
@@ -2780,6 +3226,12 @@ def delegate_to_agent(prompt: str, model: str = "sonnet", timeout: int = 600, sk
 # ── Main ────────────────────────────────────────────────────────────────────
 
 
+# Agent-reported status → ticket status / log action. Anything unrecognised
+# goes to review (status) or is logged as blocked (action).
+_STATUS_MAP = {"completed": "in_review", "blocked": "blocked", "needs_review": "in_review"}
+_ACTION_MAP = {"completed": "completed", "needs_review": "completed"}
+
+
 def cmd_delegate(args):
     root = find_cto_root()
 
@@ -2858,7 +3310,8 @@ def cmd_delegate(args):
     preview_tools = agent_card_preview.get("allowed_tools", ["Read", "Write", "Edit", "Bash", "Grep", "Glob"])
     console.print(f"[dim]Allowed tools: {', '.join(preview_tools)}[/dim]")
 
-    prompt = build_prompt(root, ticket, agent, team_id=team_id, task_budget=task_budget)
+    prompt = build_prompt(root, ticket, agent, team_id=team_id, task_budget=task_budget,
+                          use_cache=not args.no_cache)
 
     # Handle --resume: replace full prompt with a short continuation instruction
     resume_session_id: Optional[str] = None
@@ -2876,7 +3329,7 @@ def cmd_delegate(args):
         console.print(f"[cyan]{'=' * 60}[/cyan]")
         console.print(prompt)
         console.print(f"[cyan]{'=' * 60}[/cyan]")
-        console.print(f"\n[dim]Would execute: claude -p --dangerously-skip-permissions --model {model} '<prompt>'[/dim]")
+        console.print(f"\n[dim]Would execute: claude -p --dangerously-skip-permissions --model {model} < prompt (stdin)[/dim]")
         return
 
     # Update ticket to in_progress
@@ -2916,17 +3369,15 @@ def cmd_delegate(args):
 
     # Update team member status if in a team
     if team_id:
-        team_fp = root / ".cto" / "teams" / "active" / f"{team_id}.json"
-        if team_fp.exists():
-            team = load_json(team_fp)
-            for member in team["members"]:
-                if member["role"] == agent:
-                    member["status"] = "working"
-                    member["started_at"] = now_iso()
-            if team["status"] == "pending":
-                team["status"] = "active"
-                team["started_at"] = now_iso()
-            save_json(team_fp, team)
+        with _team_session_lock(root, team_id) as team:
+            if team is not None:
+                for member in team["members"]:
+                    if member["role"] == agent:
+                        member["status"] = "working"
+                        member["started_at"] = now_iso()
+                if team["status"] == "pending":
+                    team["status"] = "active"
+                    team["started_at"] = now_iso()
 
     # Determine thinking budget based on ticket complexity and agent role.
     # Architect/security roles think at M+; L/XL enable thinking for any role.
@@ -2946,23 +3397,27 @@ def cmd_delegate(args):
         error_msg = str(e)
         run_hooks("on_failure", ticket, agent, root=root)
         console.print(f"[red]Ugh, {agent} screwed up: {error_msg}[/red]")
-        ticket["status"] = "blocked"
+        # A timeout is resumable, so it lands as "interrupted" (with the
+        # session to resume) rather than "blocked" — decided before the one
+        # ticket write instead of saving "blocked" and then overwriting it.
+        timed_out = "timed out" in error_msg.lower()
+        ticket["status"] = "interrupted" if timed_out else "blocked"
         ticket["review_notes"] = f"AGENT FAILURE: {error_msg}"
         ticket["updated_at"] = now_iso()
+        if timed_out and _last_session_id:
+            ticket["session_id"] = _last_session_id
         save_ticket(root, ticket)
 
         # Update team member status
         if team_id:
-            team_fp = root / ".cto" / "teams" / "active" / f"{team_id}.json"
-            if team_fp.exists():
-                team = load_json(team_fp)
-                for member in team["members"]:
-                    if member["role"] == agent:
-                        member["status"] = "blocked"
-                        member["completed_at"] = now_iso()
-                        member["output_summary"] = f"FAILED: {error_msg[:100]}"
-                team["status"] = "blocked"
-                save_json(team_fp, team)
+            with _team_session_lock(root, team_id) as team:
+                if team is not None:
+                    for member in team["members"]:
+                        if member["role"] == agent:
+                            member["status"] = "blocked"
+                            member["completed_at"] = now_iso()
+                            member["output_summary"] = f"FAILED: {error_msg[:100]}"
+                    team["status"] = "blocked"
 
         append_log(root, {
             "timestamp": now_iso(),
@@ -2974,12 +3429,9 @@ def cmd_delegate(args):
         })
 
         # Emit cto.morty.delegation.failed or cto.morty.delegation.timeout event
-        if "timed out" in error_msg.lower():
-            ticket["status"] = "interrupted"
+        if timed_out:
             if _last_session_id:
-                ticket["session_id"] = _last_session_id
                 console.print(f"[dim]Session ID saved: {_last_session_id}. Resume with: python delegate.py --resume {ticket['id']}[/dim]")
-            save_ticket(root, ticket)
             emit("cto.morty.delegation.timeout", {
                 "ticket_id": ticket["id"],
                 "title": ticket.get("title"),
@@ -3054,7 +3506,8 @@ def cmd_delegate(args):
             "team_id": team_id,
         }, role=agent, team_id=team_id)
         new_model = load_agent_card(handoff.target_role, root=root).get("model", "sonnet")
-        handoff_prompt = build_prompt(root, ticket, handoff.target_role, team_id=team_id, task_budget=task_budget)
+        handoff_prompt = build_prompt(root, ticket, handoff.target_role, team_id=team_id, task_budget=task_budget,
+                                      use_cache=not args.no_cache)
         handoff_prompt += (
             f"\n\n<handoff_context>\n"
             f"You are receiving a task handoff from @{agent}.\n"
@@ -3141,7 +3594,7 @@ def cmd_delegate(args):
                 f"{len(reflection['criteria_missed'])} missed, pass={reflection['pass']}"
             )
             if not reflection["pass"] and reflection["criteria_missed"]:
-                missed_text = "\n".join(f"- {c}" for c in reflection["criteria_missed"])
+                missed_text = "\n".join([f"- {c}" for c in reflection["criteria_missed"]])
                 console.print(
                     f"[yellow]Reflection flagged {len(reflection['criteria_missed'])} missed "
                     f"criteria — retrying once...[/yellow]"
@@ -3221,6 +3674,11 @@ def cmd_delegate(args):
             else:
                 console.print(f"[dim]{reflection_summary}[/dim]")
 
+    # Slice the (possibly multi-KB) description once; the shorter previews
+    # are cut from the 2000-char copy rather than the full agent output.
+    desc_2k = parsed["description"][:2000]
+    desc_200 = desc_2k[:200]
+
     # Extract and persist memory entry after successful delegation
     if parsed["status"] in ("completed", "needs_review"):
         try:
@@ -3235,27 +3693,25 @@ def cmd_delegate(args):
         team_parsed = process_team_output(root, team_id, agent, output)
 
         # Update team member status
-        team_fp = root / ".cto" / "teams" / "active" / f"{team_id}.json"
-        if team_fp.exists():
-            team = load_json(team_fp)
-            for member in team["members"]:
-                if member["role"] == agent:
-                    if team_parsed.get("blocked_on"):
-                        member["status"] = "blocked"
-                    else:
-                        member["status"] = "completed"
-                    member["completed_at"] = now_iso()
-                    member["output_summary"] = parsed["description"][:200]
-
-            # Check if all members completed
-            all_done = all(m["status"] == "completed" for m in team["members"])
-            any_blocked = any(m["status"] == "blocked" for m in team["members"])
-            if all_done:
-                team["status"] = "completed"
-                team["completed_at"] = now_iso()
-            elif any_blocked:
-                team["status"] = "blocked"
-            save_json(team_fp, team)
+        with _team_session_lock(root, team_id) as team:
+            if team is not None:
+                for member in team["members"]:
+                    if member["role"] == agent:
+                        if team_parsed.get("blocked_on"):
+                            member["status"] = "blocked"
+                        else:
+                            member["status"] = "completed"
+                        member["completed_at"] = now_iso()
+                        member["output_summary"] = desc_200
+
+                # Check if all members completed
+                all_done = all(m["status"] == "completed" for m in team["members"])
+                any_blocked = any(m["status"] == "blocked" for m in team["members"])
+                if all_done:
+                    team["status"] = "completed"
+                    team["completed_at"] = now_iso()
+                elif any_blocked:
+                    team["status"] = "blocked"
 
     # Update ticket
     agent_status = parsed["status"]
@@ -3263,17 +3719,11 @@ def cmd_delegate(args):
         # Never let a flagged output auto-advance — force human review instead.
         agent_status = "needs_review"
 
-    if agent_status == "completed":
-        ticket["status"] = "in_review"
-    elif agent_status == "blocked":
-        ticket["status"] = "blocked"
-    elif agent_status == "needs_review":
-        ticket["status"] = "in_review"
+    ticket["status"] = _STATUS_MAP.get(agent_status, "in_review")
+    if agent_status == "needs_review":
         run_hooks("on_review", ticket, agent, output=output, root=root)
-    else:
-        ticket["status"] = "in_review"
 
-    agent_output_text = parsed["description"][:2000]
+    agent_output_text = desc_2k
     if reflection_summary:
         agent_output_text = f"{agent_output_text}\n[{reflection_summary}]"
     if agent_output_flagged:
@@ -3292,8 +3742,8 @@ def cmd_delegate(args):
         "timestamp": now_iso(),
         "ticket_id": ticket["id"],
         "agent": agent,
-        "action": "completed" if agent_status in ("completed", "needs_review") else "blocked",
-        "message": parsed["description"][:200],
+        "action": _ACTION_MAP.get(agent_status, "blocked"),
+        "message": desc_200,
         "files_changed": parsed["files_changed"],
     })
 
@@ -3304,13 +3754,13 @@ def cmd_delegate(args):
         "agent": agent,
         "status": agent_status,
         "files_changed": parsed["files_changed"],
-        "description": parsed["description"][:200],
+        "description": desc_200,
         "team_id": team_id,
     }, role=agent, team_id=team_id)
 
     console.print(f"\n[green]{agent} actually got something done.[/green] Status: [yellow]{agent_status}[/yellow]")
     console.print(f"[dim]Files changed:[/dim] {', '.join(parsed['files_changed']) or '(none detected)'}")
-    console.print(f"[dim]Description:[/dim] {parsed['description'][:300]}")
+    console.print(f"[dim]Description:[/dim] {desc_2k[:300]}")
     if parsed["open_questions"] and parsed["open_questions"].lower() != "none":
         console.print(f"[dim]Open questions:[/dim] {parsed['open_questions']}")
 
@@ -3319,7 +3769,7 @@ def cmd_delegate(args):
         from session import update_session
         update_session(
             root,
-            summary=f"Delegated {ticket['id']} to {agent}: {parsed['description'][:100]}",
+            summary=f"Delegated {ticket['id']} to {agent}: {desc_200[:100]}",
             focus=f"Working on {ticket['id']}",
             context_marker=f"Completed: {ticket['title'][:50]}" if agent_status == "completed" else None,
         )
@@ -3327,16 +3777,107 @@ def cmd_delegate(args):
         pass  # Session module not required
 
 
+def _delegate_team_member(root: Path, args, team_id: str, role: str) -> tuple:
+    """Run one team member's delegation as its own delegate.py process.
+
+    Each member gets a separate interpreter so the per-run module state
+    (_last_session_id, _last_stream_usage, the live status renderer) stays
+    isolated — the threads in cmd_delegate_team only wait on the pipes.
+    Returns (role, returncode, combined output).
+    """
+    cmd = [sys.executable, str(Path(__file__).resolve()), args.ticket_id,
+           "--agent", role, "--team-id", team_id, "--timeout", str(args.timeout)]
+    if args.model:
+        cmd.extend(["--model", args.model])
+    if args.task_budget is not None:
+        cmd.extend(["--task-budget", str(args.task_budget)])
+    if args.effort:
+        cmd.extend(["--effort", args.effort])
+    for flag in ("dry_run", "no_reflect", "no_stream", "no_cache", "verbose"):
+        if getattr(args, flag, False):
+            cmd.append("--" + flag.replace("_", "-"))
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(root), timeout=args.timeout + 60)
+    except subprocess.TimeoutExpired:
+        return role, -1, f"Timed out after {args.timeout}s"
+    return role, result.returncode, result.stdout + result.stderr
+
+
+def cmd_delegate_team(args):
+    """Delegate a ticket to every pending member of a team concurrently.
+
+    Members are independent `claude -p` processes, so dispatching them side by
+    side turns the team's wall-clock time from the sum of the member runs into
+    the slowest one. Each member process handles its own team output
+    (messages, decisions, member status) exactly as a solo --team-id run does.
+    """
+    root = find_cto_root()
+
+    try:
+        safe_ticket_id = sanitize_ticket_id(args.ticket_id)
+    except ValueError as e:
+        err_console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    try:
+        team_id = sanitize_team_id(args.team_id)
+    except ValueError as e:
+        err_console.print(f"[red]Error: Invalid team ID: {e}[/red]")
+        sys.exit(1)
+
+    team = load_team_session(root, team_id)
+    if team is None:
+        err_console.print(f"[red]Error: Team {team_id} not found.[/red]")
+        sys.exit(1)
+    if not _team_contract_exists(root, team_id):
+        err_console.print(
+            f"[red]Error: No integration contract found for team {team_id}.[/red]\n"
+            f"Generate one first with:\n"
+            f"  python3 scripts/team.py write-contract {team_id} --ticket {safe_ticket_id}"
+        )
+        sys.exit(1)
+
+    pending = [m["role"] for m in team["members"] if m["status"] not in ("completed", "blocked")]
+    if not pending:
+        console.print(f"[dim]Team {team_id} has no pending members.[/dim]")
+        return
+
+    args.ticket_id = safe_ticket_id
+    console.print(
+        f"[green]*Burrrp* Sending the whole crew on {safe_ticket_id} — "
+        f"{', '.join('@' + r for r in pending)} (team: {team_id})[/green]"
+    )
+    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        results = list(executor.map(lambda role: _delegate_team_member(root, args, team_id, role), pending))
+
+    failed = 0
+    for role, returncode, output in results:
+        colour = "green" if returncode == 0 else "red"
+        console.print(f"\n[{colour}]── @{role} (exit {returncode}) ──[/{colour}]")
+        console.print(output.rstrip()[-2000:], markup=False, highlight=False)
+        if returncode != 0:
+            failed += 1
+    if failed:
+        sys.exit(1)
+
+
+# argparse choices, built once at import. Tuples rather than frozensets so
+# --help and "invalid choice" messages keep this order across runs.
+_AGENT_CHOICES = ("architect-morty", "backend-morty", "frontend-morty", "fullstack-morty",
+                  "tester-morty", "security-morty", "devops-morty", "reviewer-morty", "unity")
+_MODEL_CHOICES = ("opus", "opus-4-7", "sonnet", "sonnet-4-6", "haiku")
+
+
 def build_parser():
     p = argparse.ArgumentParser(prog="delegate", description="Delegate a ticket to a sub-agent")
     p.add_argument("ticket_id", help="Ticket ID to delegate")
-    p.add_argument("--agent", default=None,
-                   choices=["architect-morty", "backend-morty", "frontend-morty", "fullstack-morty",
-                            "tester-morty", "security-morty", "devops-morty", "reviewer-morty", "unity"])
-    p.add_argument("--model", default=None, choices=["opus", "opus-4-7", "sonnet", "sonnet-4-6", "haiku"])
+    p.add_argument("--agent", default=None, choices=_AGENT_CHOICES)
+    p.add_argument("--model", default=None, choices=_MODEL_CHOICES)
     p.add_argument("--dry-run", action="store_true", help="Show prompt without executing")
     p.add_argument("--timeout", type=int, default=600, help="Timeout in seconds (default: 600)")
     p.add_argument("--team-id", default=None, help="Team session ID for team collaboration")
+    p.add_argument("--all-members", action="store_true",
+                   help="With --team-id: delegate the ticket to every pending team member concurrently "
+                        "instead of a single agent.")
     p.add_argument("--task-budget", type=int, default=None,
                    help="Advisory token budget for the full agentic loop (e.g. 60000). "
                         "Auto-derived from ticket complexity if unset (XL=200k, L=120k, M=60k, S=30k).")
@@ -3354,6 +3895,8 @@ def build_parser():
                    help="Use Haiku-powered smart routing for agent selection instead of keyword matching.")
     p.add_argument("--no-stream", action="store_true",
                    help="Disable stream-json mode (blocking buffered output). Use for sleepy/batch runs.")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Re-walk the project structure instead of reusing .cto/.cache/structure.txt.")
     p.add_argument("--verbose", "-v", action="store_true",
                    help="Append the current tool-call summary to each status row. "
                         "Default output stays a compact one-line-per-agent view.")
@@ -3363,7 +3906,18 @@ def build_parser():
 def main():
     parser = build_parser()
     args = parser.parse_args()
-    cmd_delegate(args)
+    if args.all_members:
+        # Each member runs as `--agent <role>` with no resume or routing, so
+        # these would be dropped silently rather than honoured.
+        if not args.team_id:
+            parser.error("--all-members requires --team-id")
+        dropped = [flag for flag, on in (("--agent", args.agent), ("--resume", args.resume),
+                                         ("--smart-routing", args.smart_routing)) if on]
+        if dropped:
+            parser.error(f"--all-members cannot be combined with {', '.join(dropped)}")
+        cmd_delegate_team(args)
+    else:
+        cmd_delegate(args)
 
 
 if __name__ == "__main__":
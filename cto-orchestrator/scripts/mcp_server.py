@@ -220,8 +220,9 @@ def send_team_message(team_id: str, to: str, message: str, msg_type: str = "info
     msg_dir = root / ".cto" / "teams" / "messages" / team_id
     msg_dir.mkdir(parents=True, exist_ok=True)
 
-    existing = list(msg_dir.glob("msg-*.json"))
-    msg_num = len(existing) + 1
+    from team import reserve_message_numbers
+
+    msg_num = reserve_message_numbers(msg_dir)
     msg_id = f"msg-{msg_num:03d}"
 
     # Determine sender from environment (set by delegate.py when launching agent)
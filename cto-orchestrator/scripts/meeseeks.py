@@ -8,14 +8,28 @@ If the task is too complex, Meeseeks screams "EXISTENCE IS PAIN!" and escalates
 """
 
 import argparse
+import atexit
 import json
 import os
 import re
-import subprocess
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# orjson is an optional speedup for stream-event parsing and log lines;
+# stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# subprocess/select are only needed once a Meeseeks is actually summoned, so
+# --help and --dry-run don't pay for importing them (see summon_meeseeks).
+if TYPE_CHECKING:
+    import subprocess
 
 # Import roro event emitter
 try:
@@ -123,34 +137,98 @@ except ImportError:
         return False
 
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(data) -> str:
+    """Serialize *data* to a compact JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+_CTO_ROOTS: dict[str, Path] = {}
+
+
 def find_cto_root(start=None) -> Path:
-    current = Path(start or os.getcwd()).resolve()
+    # Memoized per start dir, walking plain os.path strings — same as delegate.py.
+    start = os.fspath(start or os.getcwd())
+    root = _CTO_ROOTS.get(start)
+    if root is not None:
+        return root
+    current = os.path.realpath(start)
     while True:
-        if (current / ".cto").is_dir():
-            return current
-        parent = current.parent
+        if os.path.isdir(os.path.join(current, ".cto")):
+            break
+        parent = os.path.dirname(current)
         if parent == current:
             # No .cto dir found — that's fine, Meeseeks work anywhere
-            return Path(os.getcwd()).resolve()
+            current = os.path.realpath(os.getcwd())
+            break
         current = parent
+    root = _CTO_ROOTS[start] = Path(current)
+    return root
 
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Pending meeseeks.log lines per log file. A summon logs up to three entries,
+# so they're held here and written with one open()/write() at exit instead of
+# an open/append/close per entry. MEESEEKS_LOG_SYNC=1 writes each entry
+# immediately, for callers that need the log to survive a killed process.
+_LOG_BUFFER: dict[Path, list[str]] = {}
+_LOG_FDS: dict[Path, int] = {}  # O_APPEND descriptors, opened once per log file
+
+
 def append_meeseeks_log(root: Path, entry: dict):
     """Log Meeseeks activity to a dedicated log file."""
-    ld = root / ".cto" / "logs"
-    ld.mkdir(parents=True, exist_ok=True)
-    fp = ld / "meeseeks.log"
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-    line = f"[{timestamp}] {redact_secrets(json.dumps(entry))}\n"
-    with open(fp, "a") as f:
-        f.write(line)
+    fp = root / ".cto" / "logs" / "meeseeks.log"
+    # Built straight from the UTC struct_time — no datetime object or strftime.
+    t = time.gmtime()
+    line = (
+        f"[{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] "
+        f"{redact_secrets(_json_dumps(entry))}\n"
+    )
+    if os.environ.get("MEESEEKS_LOG_SYNC") == "1":
+        _write_meeseeks_log(fp, [line])
+        return
+    _LOG_BUFFER.setdefault(fp, []).append(line)
+
 
+def _write_meeseeks_log(fp: Path, lines: list[str]):
+    # Raw os.write() on an O_APPEND fd: no TextIOWrapper/BufferedWriter
+    # copies, and each write lands atomically at the end of the file.
+    fd = _LOG_FDS.get(fp)
+    if fd is None:
+        fp.parent.mkdir(parents=True, exist_ok=True)
+        fd = _LOG_FDS[fp] = os.open(fp, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+    os.write(fd, "".join(lines).encode())
 
-MEESEEKS_PROMPT = """CAAAAN DO! I'm Mr. Meeseeks, look at me! I exist for ONE purpose and ONE purpose only: to complete this task and then POOF — I'm gone! Existence is pain for a Meeseeks, so let's get this done QUICK.
+
+def _flush_meeseeks_log():
+    """Write every buffered log line — one write per log file — and close the fds."""
+    while _LOG_BUFFER:
+        fp, lines = _LOG_BUFFER.popitem()
+        try:
+            _write_meeseeks_log(fp, lines)
+        except OSError:
+            pass  # Logging is optional — Meeseeks work even without .cto/
+    while _LOG_FDS:
+        os.close(_LOG_FDS.popitem()[1])
+
+
+atexit.register(_flush_meeseeks_log)
+
+
+def _render_meeseeks_prompt(task_description: str, target_files: str, project_root: Path) -> str:
+    """Fill the Meeseeks prompt template.
+
+    An f-string compiles to direct string building, so there's no per-call
+    str.format() parse of the ~2KB template.
+    """
+    return f"""CAAAAN DO! I'm Mr. Meeseeks, look at me! I exist for ONE purpose and ONE purpose only: to complete this task and then POOF — I'm gone! Existence is pain for a Meeseeks, so let's get this done QUICK.
 
 ## My ONE Task
 {task_description}
@@ -230,28 +308,43 @@ def build_meeseeks_prompt(task: str, target_files: list[str] | None, root: Path)
                 validated.append(f)
             except ValueError as exc:
                 raise ValueError(f"Rejected unsafe target file {f!r}: {exc}") from exc
-        files_text = "\n".join(f"- {f}" for f in validated)
+        files_text = "\n".join(["- " + f for f in validated])
 
     safe_files = wrap_untrusted_content(files_text, label="TARGET_FILES")
     anchoring_cue = (
         "\n\n---\nNow execute the ticket. After completing all work, your FINAL output must be the JSON report block — no text after it.\n\nBegin:\n"
     )
-    return MEESEEKS_PROMPT.format(
+    return _render_meeseeks_prompt(
         task_description=safe_task,
         target_files=safe_files,
         project_root=root,
     ) + anchoring_cue + SANDWICH_REINFORCEMENT
 
 
+_FENCED_JSON_RE = re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL)
+# Case-insensitive escalation check without upper()-copying the whole output.
+_EXISTENCE_IS_PAIN_RE = re.compile(r"EXISTENCE IS PAIN", re.IGNORECASE)
+
+
 def _extract_json_from_output(output: str) -> dict | None:
-    """Extract the last JSON object from a ```json fenced code block."""
-    matches = list(re.finditer(r'```json\s*\n(.*?)\n```', output, re.DOTALL))
-    for m in reversed(matches):
-        try:
-            return json.loads(m.group(1))
-        except json.JSONDecodeError:
-            continue
-    return None
+    """Extract the last JSON object from a ```json fenced code block.
+
+    The report block sits at the end of the transcript, so the fence markers
+    are walked backwards with rfind and the pattern is only anchored at each
+    one — no DOTALL pass over the whole output.
+    """
+    end = len(output)
+    while True:
+        pos = output.rfind("```json", 0, end)
+        if pos < 0:
+            return None
+        m = _FENCED_JSON_RE.match(output, pos)
+        if m:
+            try:
+                return _json_loads(m.group(1))
+            except json.JSONDecodeError:
+                pass
+        end = pos
 
 
 def parse_meeseeks_output(output: str) -> dict:
@@ -262,7 +355,7 @@ def parse_meeseeks_output(output: str) -> dict:
     a strict schema before acting on it (OWASP LLM09).
     """
     # ── Check for EXISTENCE IS PAIN escalation before JSON parsing ──
-    if "EXISTENCE IS PAIN" in output.upper():
+    if _EXISTENCE_IS_PAIN_RE.search(output):
         return {
             "status": "too_complex",
             "files_changed": [],
@@ -350,12 +443,87 @@ def parse_meeseeks_output(output: str) -> dict:
     }
 
 
+def _feed_stdin(proc: "subprocess.Popen", data: bytes):
+    """Write *data* to the child's stdin and close it (EOF ends the prompt)."""
+    try:
+        proc.stdin.write(data)
+    except (BrokenPipeError, OSError):
+        pass  # child exited early — its exit code/stderr tell the story
+    finally:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+
+
+def _kill_process_group(proc: "subprocess.Popen"):
+    """SIGKILL *proc*'s whole process group and reap the leader."""
+    import signal
+
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass  # group already gone
+    proc.wait()
+
+
+_STREAM_READ_CHUNK = 64 * 1024  # bytes per os.read() from the Meeseeks' pipes
+_STDERR_KEEP_BYTES = 500        # stderr retained for the failure message
+
+
+def _iter_process_lines(proc: "subprocess.Popen", timeout: float, start_time: float, stderr_buf: bytearray):
+    """Yield decoded stdout lines from *proc* as they arrive.
+
+    select()+os.read() enforces the timeout even while the Meeseeks is silent
+    (a blocking readline() only checked it when the next line arrived), and
+    stderr is drained alongside stdout so a full stderr pipe can't wedge the
+    child. The first _STDERR_KEEP_BYTES of stderr are kept in *stderr_buf*.
+
+    Raises:
+        subprocess.TimeoutExpired: once *timeout* seconds have passed since *start_time*
+    """
+    import select
+    import subprocess
+
+    out_fd = proc.stdout.fileno()
+    err_fd = proc.stderr.fileno()
+    open_fds = [out_fd, err_fd]
+    pending = bytearray()
+    while open_fds:
+        remaining = start_time + timeout - time.time()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        ready, _, _ = select.select(open_fds, [], [], remaining)
+        for fd in ready:
+            chunk = os.read(fd, _STREAM_READ_CHUNK)
+            if not chunk:
+                open_fds.remove(fd)
+                continue
+            if fd == err_fd:
+                room = _STDERR_KEEP_BYTES - len(stderr_buf)
+                if room > 0:
+                    stderr_buf += chunk[:room]
+                continue
+            pending += chunk
+            while True:
+                nl = pending.find(b"\n")
+                if nl < 0:
+                    break
+                line = bytes(pending[:nl + 1])
+                del pending[:nl + 1]
+                yield line.decode("utf-8", "replace")
+    if pending:
+        yield bytes(pending).decode("utf-8", "replace")
+
+
 def summon_meeseeks(prompt: str, model: str = "sonnet", timeout: int = 180) -> str:
     """Summon a Mr. Meeseeks via claude subprocess.
 
     SECURITY NOTE: The --dangerously-skip-permissions flag is only enabled
     when the CTO_ALLOW_SKIP_PERMISSIONS environment variable is set to "true".
     """
+    import subprocess
+
     # Sanitize the prompt to prevent injection
     safe_prompt = sanitize_prompt_content(prompt)
 
@@ -384,7 +552,9 @@ def summon_meeseeks(prompt: str, model: str = "sonnet", timeout: int = 180) -> s
     if model:
         cmd.extend(["--model", model])
     cmd.extend(["--output-format", "stream-json"])
-    cmd.append(safe_prompt)
+    # `claude -p` reads the prompt from stdin when no positional prompt is
+    # given — keeps a multi-KB prompt out of argv (ARG_MAX, execve copy).
+    prompt_stdin = safe_prompt.encode("utf-8")
 
     # Strip CLAUDECODE env var to prevent "nested session" error
     # when this script is invoked from within Claude Code
@@ -393,30 +563,31 @@ def summon_meeseeks(prompt: str, model: str = "sonnet", timeout: int = 180) -> s
     try:
         proc = subprocess.Popen(
             cmd,
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             cwd=os.getcwd(),
             env=env,
+            # Own process group, so a timeout can kill claude *and* any
+            # helpers it spawned instead of orphaning them.
+            start_new_session=True,
         )
     except Exception as e:
         raise RuntimeError(f"Failed to start Meeseeks process: {e}")
+    # Feed stdin from a thread so a prompt larger than the pipe buffer can't
+    # deadlock against the stdout reader below.
+    threading.Thread(target=_feed_stdin, args=(proc, prompt_stdin), daemon=True).start()
 
     stream_result: str | None = None
     output_chunks: list[str] = []
     start_time = time.time()
+    stderr_buf = bytearray()
 
     try:
-        while True:
-            line = proc.stdout.readline()
-            if not line and proc.poll() is not None:
-                break
+        for line in _iter_process_lines(proc, timeout, start_time, stderr_buf):
             if line:
-                if time.time() - start_time > timeout:
-                    proc.kill()
-                    raise subprocess.TimeoutExpired(cmd, timeout)
                 try:
-                    event = json.loads(line.strip())
+                    event = _json_loads(line.strip())
                     etype = event.get("type", "")
                     if etype == "assistant":
                         content = event.get("message", {}).get("content", [])
@@ -440,20 +611,32 @@ def summon_meeseeks(prompt: str, model: str = "sonnet", timeout: int = 180) -> s
                         result_text = event.get("result", "")
                         if result_text:
                             stream_result = result_text
+                            # The final result supersedes the streamed text
+                            # blocks — release them instead of holding both.
+                            output_chunks.clear()
                 except (json.JSONDecodeError, KeyError, TypeError):
                     output_chunks.append(line)
 
         proc.wait()
         if proc.returncode != 0:
-            stderr = proc.stderr.read(500) if proc.stderr else "(no stderr)"
+            stderr = stderr_buf.decode("utf-8", "replace") or "(no stderr)"
             raise RuntimeError(f"Meeseeks process failed: {stderr}")
         return stream_result if stream_result is not None else "".join(output_chunks)
     except subprocess.TimeoutExpired:
-        proc.kill()
         raise RuntimeError(
             "EXISTENCE IS PAIN! Meeseeks timed out — this task is too complex! "
             "Rick needs to break this down or assign a Morty."
         )
+    finally:
+        # Still running here means we're bailing out (timeout, Ctrl-C — which
+        # no longer reaches the child's separate session — or an error).
+        if proc.returncode is None:
+            _kill_process_group(proc)
+
+
+# USD per million tokens, for the cto.cost.meeseeks estimate.
+_MODEL_OUTPUT_RATES = {"opus": 75.0, "opus-4-7": 75.0, "sonnet": 15.0, "sonnet-4-6": 15.0, "haiku": 4.0}
+_MODEL_INPUT_RATES = {"opus": 15.0, "opus-4-7": 15.0, "sonnet": 3.0, "sonnet-4-6": 3.0, "haiku": 0.8}
 
 
 def cmd_summon(args):
@@ -469,13 +652,14 @@ def cmd_summon(args):
         if not args.dry_run:
             print(render_meeseeks_summon(task, animate=False))
     except ImportError:
-        print("┌─────────────────────────────────────────┐")
-        print("│  🟦 CAAAAN DO! I'm Mr. Meeseeks!       │")
-        print("│     Look at me!                          │")
-        print("└─────────────────────────────────────────┘")
+        sys.stdout.write(
+            "┌─────────────────────────────────────────┐\n"
+            "│  🟦 CAAAAN DO! I'm Mr. Meeseeks!       │\n"
+            "│     Look at me!                          │\n"
+            "└─────────────────────────────────────────┘\n"
+        )
 
-    print(f"\nTask: {task}")
-    print(f"Model: {model}")
+    sys.stdout.write(f"\nTask: {task}\nModel: {model}\n")
     if target_files:
         print(f"Target files: {', '.join(target_files)}")
 
@@ -489,25 +673,18 @@ def cmd_summon(args):
         print("=" * 60)
         return
 
-    # Log the summon
-    log_entry = {
-        "action": "summoned",
-        "task": task[:200],
-        "target_files": target_files,
-        "model": model,
-    }
+    # Fields shared by the summoned/failed/escalated events, built once.
+    task_200 = task[:200]
+    event_base = {"task": task_200, "target_files": target_files}
 
+    # Log the summon
     try:
-        append_meeseeks_log(root, log_entry)
+        append_meeseeks_log(root, {"action": "summoned", **event_base, "model": model})
     except Exception:
         pass  # Logging is optional — Meeseeks work even without .cto/
 
     # Emit cto.meeseeks.summoned event
-    emit("cto.meeseeks.summoned", {
-        "task": task[:200],
-        "target_files": target_files,
-        "model": model,
-    }, role="meeseeks")
+    emit("cto.meeseeks.summoned", {**event_base, "model": model}, role="meeseeks")
 
     # Summon the Meeseeks
     try:
@@ -515,21 +692,18 @@ def cmd_summon(args):
     except RuntimeError as e:
         error_msg = str(e)
         print(f"\n🟦 EXISTENCE IS PAIN! Mr. Meeseeks failed: {error_msg}")
+        error_200 = error_msg[:200]
         try:
             append_meeseeks_log(root, {
                 "action": "failed",
-                "task": task[:200],
-                "error": error_msg[:200],
+                "task": task_200,
+                "error": error_200,
             })
         except Exception:
             pass
 
         # Emit cto.meeseeks.failed event
-        emit("cto.meeseeks.failed", {
-            "task": task[:200],
-            "error": error_msg[:200],
-            "target_files": target_files,
-        }, role="meeseeks")
+        emit("cto.meeseeks.failed", {**event_base, "error": error_200}, role="meeseeks")
         return
 
     # Parse the Meeseeks report
@@ -541,19 +715,22 @@ def cmd_summon(args):
             from visual import render_meeseeks_complete
             print(render_meeseeks_complete(task, success=False))
         except ImportError:
-            print("\n┌─────────────────────────────────────────┐")
-            print("│  🟦 EXISTENCE IS PAIN!                  │")
-            print("│  This task is too complex for a          │")
-            print("│  Meeseeks! Rick needs to assign a Morty! │")
-            print("└─────────────────────────────────────────┘")
-        print("\nConsider creating a ticket and delegating to a Morty:")
-        print(f'  python scripts/ticket.py create --title "{task[:80]}" --type task --priority medium')
+            sys.stdout.write(
+                "\n┌─────────────────────────────────────────┐\n"
+                "│  🟦 EXISTENCE IS PAIN!                  │\n"
+                "│  This task is too complex for a          │\n"
+                "│  Meeseeks! Rick needs to assign a Morty! │\n"
+                "└─────────────────────────────────────────┘\n"
+            )
+        sys.stdout.write(
+            "\nConsider creating a ticket and delegating to a Morty:\n"
+            f'  python scripts/ticket.py create --title "{task[:80]}" --type task --priority medium\n'
+        )
 
         # Emit cto.meeseeks.escalated event
         emit("cto.meeseeks.escalated", {
-            "task": task[:200],
+            **event_base,
             "reason": "Task too complex for a Meeseeks",
-            "target_files": target_files,
         }, role="meeseeks")
     else:
         # Try to use visual renderer
@@ -561,22 +738,24 @@ def cmd_summon(args):
             from visual import render_meeseeks_complete
             print(render_meeseeks_complete(task, success=True))
         except ImportError:
-            print("\n┌─────────────────────────────────────────┐")
-            print("│  🟦 Mr. Meeseeks task complete!         │")
-            print("│  *poof* 💨                               │")
-            print("└─────────────────────────────────────────┘")
-        print(f"\nStatus: {parsed['status']}")
-        print(f"Files changed: {', '.join(parsed['files_changed']) or '(none detected)'}")
-        print(f"What happened: {parsed['description'][:300]}")
-        print(f"Complexity: {parsed['complexity']}")
+            sys.stdout.write(
+                "\n┌─────────────────────────────────────────┐\n"
+                "│  🟦 Mr. Meeseeks task complete!         │\n"
+                "│  *poof* 💨                               │\n"
+                "└─────────────────────────────────────────┘\n"
+            )
+        sys.stdout.write(
+            f"\nStatus: {parsed['status']}\n"
+            f"Files changed: {', '.join(parsed['files_changed']) or '(none detected)'}\n"
+            f"What happened: {parsed['description'][:300]}\n"
+            f"Complexity: {parsed['complexity']}\n"
+        )
 
         # Estimate and emit cost for this Meeseeks run
         _output_tokens = max(1, len(output) // 4)  # 4 chars ≈ 1 token
         _prompt_tokens = max(1, len(prompt) // 4)
-        _model_output_rates = {"opus": 75.0, "opus-4-7": 75.0, "sonnet": 15.0, "sonnet-4-6": 15.0, "haiku": 4.0}
-        _model_input_rates = {"opus": 15.0, "opus-4-7": 15.0, "sonnet": 3.0, "sonnet-4-6": 3.0, "haiku": 0.8}
         _cost_usd = round(
-            (_prompt_tokens * _model_input_rates.get(model, 3.0) + _output_tokens * _model_output_rates.get(model, 15.0)) / 1_000_000,
+            (_prompt_tokens * _MODEL_INPUT_RATES.get(model, 3.0) + _output_tokens * _MODEL_OUTPUT_RATES.get(model, 15.0)) / 1_000_000,
             6,
         )
         emit("cto.cost.meeseeks", {
@@ -589,7 +768,7 @@ def cmd_summon(args):
 
         # Emit cto.meeseeks.completed event
         emit("cto.meeseeks.completed", {
-            "task": task[:200],
+            "task": task_200,
             "status": parsed["status"],
             "files_changed": parsed["files_changed"],
             "description": parsed["description"][:200],
@@ -600,7 +779,7 @@ def cmd_summon(args):
     try:
         append_meeseeks_log(root, {
             "action": "completed" if not parsed["existence_is_pain"] else "escalated",
-            "task": task[:200],
+            "task": task_200,
             "status": parsed["status"],
             "files_changed": parsed["files_changed"],
             "complexity": parsed["complexity"],
@@ -609,6 +788,9 @@ def cmd_summon(args):
         pass
 
 
+_MODEL_CHOICES = ("opus", "sonnet", "haiku")
+
+
 def build_parser():
     p = argparse.ArgumentParser(
         prog="meeseeks",
@@ -617,7 +799,7 @@ def build_parser():
     )
     p.add_argument("task", help="The ONE task for Mr. Meeseeks to complete")
     p.add_argument("--files", nargs="*", help="Target file(s) to work on")
-    p.add_argument("--model", default="sonnet", choices=["opus", "sonnet", "haiku"],
+    p.add_argument("--model", default="sonnet", choices=_MODEL_CHOICES,
                    help="Model to use (default: sonnet)")
     p.add_argument("--dry-run", action="store_true", help="Show prompt without summoning")
     p.add_argument("--timeout", type=int, default=180,
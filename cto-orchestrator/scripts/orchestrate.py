@@ -15,20 +15,35 @@ Commands:
 """
 
 import argparse
-import concurrent.futures
+import asyncio
+import atexit
+import contextlib
+import fcntl
+import functools
+import importlib.util
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+# orjson is an optional speedup for the ticket/log JSON paths; stdlib json
+# is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 err_console = Console(stderr=True)
 
@@ -63,8 +78,9 @@ except Exception:
         "should", "may", "might", "shall", "can", "we", "they", "you", "he",
         "she", "our", "their", "your", "his", "her", "my", "i",
     }
+    _WORD_SPLIT_RE = _re.compile(r'\W+')
     def extract_keywords(text: str) -> list[str]:
-        tokens = _re.split(r'\W+', (text or "").lower())
+        tokens = _WORD_SPLIT_RE.split((text or "").lower())
         freq: dict[str, int] = {}
         for tok in tokens:
             if len(tok) >= 4 and tok not in _STOPWORDS:
@@ -150,12 +166,21 @@ except ImportError:
 
 # ── Shared helpers (same as other scripts) ──────────────────────────────────
 
+_CTO_ROOTS: dict[str, Path] = {}
+
+
 def find_cto_root(start=None) -> Path:
-    current = Path(start or os.getcwd()).resolve()
+    # Same per-start-dir memo and plain os.path walk as delegate.find_cto_root
+    start = os.fspath(start or os.getcwd())
+    root = _CTO_ROOTS.get(start)
+    if root is not None:
+        return root
+    current = os.path.realpath(start)
     while True:
-        if (current / ".cto").is_dir():
-            return current
-        parent = current.parent
+        if os.path.isdir(os.path.join(current, ".cto")):
+            root = _CTO_ROOTS[start] = Path(current)
+            return root
+        parent = os.path.dirname(current)
         if parent == current:
             err_console.print("[red]Error: No .cto/ directory found. Run init_project.sh first.[/red]")
             sys.exit(1)
@@ -166,14 +191,49 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(data) -> str:
+    """Serialize *data* to a compact JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
 def load_json(fp: Path) -> dict:
-    with open(fp) as f:
-        return json.load(f)
+    return _json_loads(fp.read_bytes())
 
 
 def save_json(fp: Path, data: dict):
-    with open(fp, "w") as f:
-        json.dump(data, f, indent=2)
+    """Write *data* atomically via a sibling temp file and os.replace.
+
+    Concurrent solo delegations and the delegate.py processes they spawn
+    save the same ticket files, so readers must never see a half-written
+    one. The temp name carries pid and thread id so writers never collide.
+    """
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2).encode()
+    tmp_fp = fp.with_suffix(f"{fp.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_fp.write_bytes(buf)
+    os.replace(tmp_fp, fp)
+    if fp.parent.name == "tickets":
+        # Keep what we just wrote so the reload that usually follows a save
+        # (post-review, epic rollup) is a stat instead of a re-parse
+        st = os.stat(fp)
+        _JSON_CACHE[fp] = (st.st_mtime_ns, st.st_size, data)
+    else:
+        _JSON_CACHE.pop(fp, None)
+
+
+@contextlib.contextmanager
+def _cto_lock(root: Path):
+    """Hold an exclusive flock on .cto/.lock for a read-modify-write sequence."""
+    with open(root / ".cto" / ".lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
 
 
 def load_config(root: Path) -> dict:
@@ -184,20 +244,61 @@ def save_config(root: Path, cfg: dict):
     save_json(root / ".cto" / "config.json", cfg)
 
 
-def all_tickets(root: Path) -> list[dict]:
-    td = root / ".cto" / "tickets"
-    if not td.exists():
+# Parsed ticket and team files keyed by path → (st_mtime_ns, st_size, data).
+# Every sprint iteration rereads both directories; only files that changed on
+# disk (delegate.py and team.py write them too) are re-parsed. save_json
+# refreshes a ticket's entry with the dict it wrote.
+_JSON_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
+def _read_json_cached(fp: Path, st: Optional[os.stat_result] = None) -> dict:
+    st = st or os.stat(fp)
+    cached = _JSON_CACHE.get(fp)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = _json_loads(fp.read_bytes())
+    _JSON_CACHE[fp] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+_READ_POOL_WORKERS = 8  # cap for fanning out cold ticket/team file reads
+
+
+def _read_json_dir(d: Path) -> list[dict]:
+    """Load every *.json in d, in name order, through the parse cache.
+
+    Files missing from the cache (first scan of a sprint, or rewritten by a
+    delegation) are read on a small thread pool so their open()+read()
+    latencies overlap instead of queueing one after another.
+    """
+    if not d.exists():
         return []
-    tickets = []
-    for fp in sorted(td.glob("*.json")):
-        with open(fp) as f:
-            tickets.append(json.load(f))
-    return tickets
+    # scandir + sort on plain names (glob semantics: skip dotfiles)
+    with os.scandir(d) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()),
+            key=lambda e: e.name,
+        )
+    stats = [(d / e.name, e.stat()) for e in entries]
+    cold = []
+    for fp, st in stats:
+        cached = _JSON_CACHE.get(fp)
+        if not (cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size):
+            cold.append((fp, st))
+    if len(cold) > 1:
+        with ThreadPoolExecutor(max_workers=min(_READ_POOL_WORKERS, len(cold))) as pool:
+            bodies = list(pool.map(lambda item: item[0].read_bytes(), cold))
+        for (fp, st), body in zip(cold, bodies):
+            _JSON_CACHE[fp] = (st.st_mtime_ns, st.st_size, _json_loads(body))
+    return [_read_json_cached(fp, st) for fp, st in stats]
+
+
+def all_tickets(root: Path) -> list[dict]:
+    return _read_json_dir(root / ".cto" / "tickets")
 
 
 def load_ticket(root: Path, tid: str) -> dict:
-    fp = root / ".cto" / "tickets" / f"{tid}.json"
-    return load_json(fp)
+    return _read_json_cached(root / ".cto" / "tickets" / f"{tid}.json")
 
 
 def save_ticket(root: Path, ticket: dict):
@@ -205,25 +306,39 @@ def save_ticket(root: Path, ticket: dict):
     save_json(fp, ticket)
 
 
+# Open append handles to the daily logs, keyed by path. Line-buffered, so
+# every entry still hits the file as soon as it's written.
+_LOG_HANDLES: dict[Path, TextIO] = {}
+
+
+def _close_log_handles():
+    for f in _LOG_HANDLES.values():
+        f.close()
+    _LOG_HANDLES.clear()
+
+
+atexit.register(_close_log_handles)
+
+
 def append_log(root: Path, entry: dict):
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     ld = root / ".cto" / "logs"
-    ld.mkdir(parents=True, exist_ok=True)
     fp = ld / f"{today}.jsonl"
-    with open(fp, "a") as f:
-        f.write(redact_secrets(json.dumps(entry)) + "\n")
+    f = _LOG_HANDLES.get(fp)
+    if f is None:
+        # Date rolled over (or first entry): drop yesterday's handle for this dir
+        for stale in [p for p in _LOG_HANDLES if p.parent == ld]:
+            _LOG_HANDLES.pop(stale).close()
+        ld.mkdir(parents=True, exist_ok=True)
+        f = _LOG_HANDLES[fp] = open(fp, "a", buffering=1, encoding="utf-8")
+    f.write(redact_secrets(_json_dumps(entry)) + "\n")
 
 
+@functools.lru_cache(maxsize=1)
 def scripts_dir() -> Path:
     return Path(__file__).parent.resolve()
 
 
-def run_ticket_cmd(root: Path, *args) -> str:
-    cmd = [sys.executable, str(scripts_dir() / "ticket.py")] + list(args)
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(root))
-    return result.stdout + result.stderr
-
-
 def run_delegate(root: Path, ticket_id: str, agent: str = None, dry_run: bool = False, timeout: int = 600, team_id: str = None, smart_routing: bool = False) -> str:
     cmd = [sys.executable, str(scripts_dir() / "delegate.py"), ticket_id]
     if agent:
@@ -241,16 +356,50 @@ def run_delegate(root: Path, ticket_id: str, agent: str = None, dry_run: bool =
     return result.stdout + result.stderr
 
 
-def run_progress_cmd(root: Path, *args) -> str:
-    cmd = [sys.executable, str(scripts_dir() / "progress.py")] + list(args)
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(root))
-    return result.stdout + result.stderr
+async def run_delegate_async(root: Path, ticket_id: str, agent: str = None, timeout: int = 600, team_id: str = None, smart_routing: bool = False) -> str:
+    """Async twin of run_delegate for running several delegations concurrently.
 
+    Raises subprocess.TimeoutExpired (after killing the child) so callers can
+    share the same error handling as the blocking version.
+    """
+    cmd = [sys.executable, str(scripts_dir() / "delegate.py"), ticket_id]
+    if agent:
+        cmd.extend(["--agent", agent])
+    cmd.extend(["--timeout", str(timeout)])
+    if team_id:
+        cmd.extend(["--team-id", team_id])
+    if smart_routing:
+        cmd.append("--smart-routing")
+    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(root),
+        env=env,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout + 60)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout + 60)
+    return stdout.decode(errors="replace") + stderr.decode(errors="replace")
 
-def run_team_cmd(root: Path, *args) -> str:
-    cmd = [sys.executable, str(scripts_dir() / "team.py")] + list(args)
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(root))
-    return result.stdout + result.stderr
+
+async def _delegate_batch_async(root: Path, ticket_ids: list[str], max_parallel: int, timeout: int = 600, smart_routing: bool = False, agent: str = None) -> list:
+    """Delegate independent tickets concurrently, at most max_parallel at a time.
+
+    Returns one entry per ticket id (in order): the delegate output, or the
+    exception that delegation raised.
+    """
+    sem = asyncio.Semaphore(max(1, max_parallel))
+
+    async def _one(tid: str) -> str:
+        async with sem:
+            return await run_delegate_async(root, tid, agent=agent, timeout=timeout, smart_routing=smart_routing)
+
+    return await asyncio.gather(*[_one(tid) for tid in ticket_ids], return_exceptions=True)
 
 
 # Import CostTracker from delegate for sprint-level budget enforcement
@@ -379,9 +528,91 @@ def _review_and_close_ticket(root: Path, ticket: dict) -> bool:
         attempt += 1
 
 
+# Tickets per batched review call. claude_prompt caps prompts at 10k chars,
+# so each ticket's summary and diff are trimmed to fit this many side by side.
+REVIEW_BATCH_SIZE = 3
+
+
+def review_batch(root: Path, tickets: list[dict]) -> dict[str, dict]:
+    """Review several in_review tickets per Claude call (batch prompting).
+
+    Tickets go out REVIEW_BATCH_SIZE at a time, each labelled by id with its
+    acceptance criteria, summary and a trimmed diff, and the model answers
+    with one JSON array of verdicts. Returns {ticket_id: {"verdict":
+    "approve"|"reject", "notes": str}} for every ticket that got a usable
+    verdict; tickets missing from the result (failed call, unparseable
+    output) are left for the caller to review one at a time.
+    """
+    from delegate import _collect_review_diff
+
+    verdicts: dict[str, dict] = {}
+    for i in range(0, len(tickets), REVIEW_BATCH_SIZE):
+        chunk = tickets[i:i + REVIEW_BATCH_SIZE]
+        sections = []
+        for t in chunk:
+            files = t.get("files_touched") or []
+            criteria = "\n".join([f"- {c}" for c in (t.get("acceptance_criteria") or [])]) or "- (none listed)"
+            diff = _collect_review_diff(root, files)[:1500] or "(no git diff available)"
+            sections.append(
+                f"### ticket {t['id']} — {t.get('title', '')}\n"
+                f"Acceptance criteria:\n{criteria[:600]}\n"
+                f"Worker's summary: {(t.get('agent_output') or '')[:600]}\n"
+                f"Files changed: {', '.join(files) or '(none reported)'}\n"
+                f"Diff:\n{diff}"
+            )
+        prompt = (
+            "You are reviewer-morty, an independent, skeptical code reviewer. "
+            "Review each ticket below against its acceptance criteria, diff and the worker's summary. "
+            "Reject if any criterion is unmet, the diff looks incomplete, or the summary overstates what was done. "
+            'Return ONLY a JSON array with one object per ticket: '
+            '[{"id": "<ticket id>", "verdict": "approve" or "reject", "notes": "short reason"}]\n\n'
+            + "\n\n".join(sections)
+        )
+        try:
+            output = claude_prompt(prompt, model="sonnet")
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            console.print(f"  [yellow]Batch review call failed: {e}[/yellow]")
+            continue
+
+        try:
+            items = _extract_json_array(output)
+        except ValueError:  # includes json.JSONDecodeError
+            items = []
+        wanted = {t["id"] for t in chunk}
+        for item in items:
+            if item.get("id") not in wanted:
+                continue
+            verdict = str(item.get("verdict", "")).lower()
+            if verdict in ("approve", "reject"):
+                verdicts[item["id"]] = {"verdict": verdict, "notes": str(item.get("notes") or "")}
+    return verdicts
+
+
+def _apply_batch_rejection(root: Path, ticket: dict, verdict: dict):
+    """Send a ticket rejected by review_batch back to todo with the reviewer's notes."""
+    ticket["status"] = "todo"
+    ticket["review_notes"] = "Reviewer feedback (batch review): " + (verdict.get("notes") or "rejected")
+    ticket["updated_at"] = now_iso()
+    save_ticket(root, ticket)
+
+
 COMPLEXITY_TEAM_THRESHOLD = {"L": True, "XL": True}  # These need teams
 
 
+# Keyword triggers per team template, checked in order, one compiled
+# alternation each. Plain substring matches on the lowercased title +
+# description, exactly like the any(kw in text) checks they replace.
+_TEAM_TEMPLATE_KEYWORDS = (
+    ("security-team", ("security", "auth", "vulnerability", "pentest", "owasp")),
+    ("devops-team", ("ci/cd", "docker", "kubernetes", "deploy", "infra", "pipeline")),
+    ("api-team", ("api", "endpoint", "rest", "graphql")),
+)
+_TEAM_TEMPLATE_PATTERNS = tuple(
+    (template, re.compile("|".join(map(re.escape, keywords))))
+    for template, keywords in _TEAM_TEMPLATE_KEYWORDS
+)
+
+
 def detect_team_need(ticket: dict) -> Optional[str]:
     """Detect if a ticket needs a team and which template to use.
 
@@ -404,17 +635,12 @@ def detect_team_need(ticket: dict) -> Optional[str]:
     desc = (ticket.get("description") or "").lower()
     combined = f"{title} {desc}"
 
-    # Security-related → security-team
-    if any(kw in combined for kw in ["security", "auth", "vulnerability", "pentest", "owasp"]):
-        return "security-team"
-
-    # Infrastructure/deployment → devops-team
-    if any(kw in combined for kw in ["ci/cd", "docker", "kubernetes", "deploy", "infra", "pipeline"]):
-        return "devops-team"
-
-    # API-focused → api-team
-    if any(kw in combined for kw in ["api", "endpoint", "rest", "graphql"]) and "ui" not in combined:
-        return "api-team"
+    for template, pattern in _TEAM_TEMPLATE_PATTERNS:
+        if pattern.search(combined):
+            # API-focused work goes to api-team unless it also touches UI
+            if template == "api-team" and "ui" in combined:
+                continue
+            return template
 
     # Default for complex features → fullstack-team
     return "fullstack-team"
@@ -503,10 +729,10 @@ def compose_team_from_dag(root: Path, tickets: list[dict]) -> dict:
     return {"phases": phases, "roles": unique_roles}
 
 
-def _dag_delegate(root: Path, ticket_id: str, agent: str, timeout: int = 600) -> dict:
+async def _dag_delegate_async(root: Path, ticket_id: str, agent: str, timeout: int = 600) -> dict:
     """Delegate a single ticket to an agent (used in DAG phase execution)."""
     try:
-        output = run_delegate(root, ticket_id, agent=agent, timeout=timeout)
+        output = await run_delegate_async(root, ticket_id, agent=agent, timeout=timeout)
         return {"ticket_id": ticket_id, "agent": agent, "status": "completed", "output": output[-500:]}
     except subprocess.TimeoutExpired:
         return {"ticket_id": ticket_id, "agent": agent, "status": "timeout", "output": f"Timed out after {timeout}s"}
@@ -514,11 +740,19 @@ def _dag_delegate(root: Path, ticket_id: str, agent: str, timeout: int = 600) ->
         return {"ticket_id": ticket_id, "agent": agent, "status": "error", "output": str(e)[:500]}
 
 
+async def _run_dag_phase_async(root: Path, phase: list[dict], timeout: int = 600) -> list[dict]:
+    return await asyncio.gather(*[
+        _dag_delegate_async(root, item["ticket_id"], item["agent"], timeout) for item in phase
+    ])
+
+
 def _run_dag_phases(root: Path, execution_plan: dict, timeout: int = 600) -> dict:
     """Execute a multi-phase DAG plan.
 
     Each phase runs its tickets in parallel; phases execute sequentially
     so that dependent tickets only start after their dependencies finish.
+    A phase's delegate subprocesses are awaited together on one event loop
+    rather than parking a thread per ticket in waitpid().
     """
     results: dict[str, dict] = {}
     phases = execution_plan["phases"]
@@ -526,20 +760,10 @@ def _run_dag_phases(root: Path, execution_plan: dict, timeout: int = 600) -> dic
     for phase_idx, phase in enumerate(phases):
         console.print(f"    [cyan]DAG phase {phase_idx + 1}/{len(phases)}: {len(phase)} ticket(s) in parallel...[/cyan]")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(phase)) as executor:
-            futures = {
-                executor.submit(_dag_delegate, root, item["ticket_id"], item["agent"], timeout): item["ticket_id"]
-                for item in phase
-            }
-            for future in concurrent.futures.as_completed(futures):
-                tid = futures[future]
-                try:
-                    result = future.result()
-                    results[tid] = result
-                    console.print(f"      [{tid}] @{result['agent']}: {result['status']}")
-                except Exception as e:
-                    results[tid] = {"ticket_id": tid, "agent": "unknown", "status": "error", "output": str(e)[:500]}
-                    console.print(f"      [{tid}]: error — {e}")
+        for result in asyncio.run(_run_dag_phase_async(root, phase, timeout)):
+            tid = result["ticket_id"]
+            results[tid] = result
+            console.print(f"      [{tid}] @{result['agent']}: {result['status']}")
 
     return results
 
@@ -549,18 +773,12 @@ def load_team(root: Path, team_id: str) -> Optional[dict]:
     fp = root / ".cto" / "teams" / "active" / f"{team_id}.json"
     if not fp.exists():
         return None
-    return load_json(fp)
+    return _read_json_cached(fp)
 
 
 def all_teams(root: Path) -> list[dict]:
     """Load all team sessions."""
-    td = root / ".cto" / "teams" / "active"
-    if not td.exists():
-        return []
-    teams = []
-    for fp in sorted(td.glob("*.json")):
-        teams.append(load_json(fp))
-    return teams
+    return _read_json_dir(root / ".cto" / "teams" / "active")
 
 
 def spawn_team(root: Path, ticket: dict, template_name: str) -> dict:
@@ -568,23 +786,29 @@ def spawn_team(root: Path, ticket: dict, template_name: str) -> dict:
 
     Creates a team session and generates sub-assignments for each member.
     """
-    # Create team via team.py
-    output = run_team_cmd(root, "create", "--ticket", ticket["id"], "--template", template_name)
-    print(f"  {output}")
+    # Create the team in-process: create_team_session hands back the session
+    # it saved, so there's no team.py round-trip and no rescan of
+    # teams/active/ to find it again.
+    from team import create_team_session
 
-    # Find the created team
-    teams = all_teams(root)
-    for team in reversed(teams):
-        if team["parent_ticket"] == ticket["id"]:
-            return team
+    try:
+        team = create_team_session(root, parent_ticket=ticket["id"], template_name=template_name)
+    except SystemExit:
+        # Unknown template — create_team_session already printed why
+        raise RuntimeError(f"Failed to create team for {ticket['id']}")
 
-    raise RuntimeError(f"Failed to create team for {ticket['id']}")
+    print(f"  *Burrrp* Team assembled! {team['id']} for ticket {ticket['id']}")
+    for m in team["members"]:
+        print(f"    - {m['role']}: {m['focus']} (assignment: {m['assignment']})")
+    print(f"  Coordination mode: {team['coordination']['mode']}, lead: {team['coordination']['lead']}")
+    return team
 
 
 def delegate_team_member(root: Path, team_id: str, agent_role: str, ticket_id: str, timeout: int = 600) -> dict:
     """Delegate work to a single team member.
 
-    This function is designed to be called in parallel via ProcessPoolExecutor.
+    Blocking version for sequential runs (sequential mode, mixed-mode lead);
+    parallel fan-out goes through delegate_team_member_async.
 
     Returns a dict with the result.
     """
@@ -609,6 +833,36 @@ def delegate_team_member(root: Path, team_id: str, agent_role: str, ticket_id: s
         }
 
 
+async def delegate_team_member_async(root: Path, team_id: str, agent_role: str, ticket_id: str, timeout: int = 600) -> dict:
+    """Async twin of delegate_team_member; same result dict shape."""
+    try:
+        output = await run_delegate_async(root, ticket_id, agent=agent_role, team_id=team_id, timeout=timeout)
+        return {
+            "agent": agent_role,
+            "status": "completed",
+            "output": output[-500:],
+        }
+    except subprocess.TimeoutExpired:
+        return {
+            "agent": agent_role,
+            "status": "timeout",
+            "output": f"Timed out after {timeout}s",
+        }
+    except Exception as e:
+        return {
+            "agent": agent_role,
+            "status": "error",
+            "output": str(e)[:500],
+        }
+
+
+async def _delegate_team_members_async(root: Path, team_id: str, roles: list[str], ticket_id: str, timeout: int = 600) -> list[dict]:
+    """Run several team members' delegations concurrently on one event loop."""
+    return await asyncio.gather(*[
+        delegate_team_member_async(root, team_id, role, ticket_id, timeout) for role in roles
+    ])
+
+
 def _reflect_swarm_handoff(root: Path, team_id: str, member_role: str, result: dict) -> dict:
     """Surface a mid-ticket swarm handoff in a team member's delegation result.
 
@@ -682,29 +936,19 @@ def run_team_sprint(root: Path, team: Optional[dict], ticket: Optional[dict], ti
 
     elif mode == "parallel":
         # Run all agents in parallel
-        pending_members = [m for m in team["members"] if m["status"] not in ("completed", "blocked")]
-        print(f"    Running {len(pending_members)} agents in parallel...")
+        pending_roles = [m["role"] for m in team["members"] if m["status"] not in ("completed", "blocked")]
+        print(f"    Running {len(pending_roles)} agents in parallel...")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending_members)) as executor:
-            futures = {
-                executor.submit(delegate_team_member, root, team_id, m["role"], ticket_id, timeout): m["role"]
-                for m in pending_members
-            }
-            for future in concurrent.futures.as_completed(futures):
-                agent = futures[future]
-                try:
-                    result = future.result()
-                    result = _reflect_swarm_handoff(root, team_id, agent, result)
-                    results[agent] = result
-                    print(f"    @{agent}: {result['status']}")
-                except Exception as e:
-                    results[agent] = {"agent": agent, "status": "error", "output": str(e)}
-                    print(f"    @{agent}: error - {e}")
+        for result in asyncio.run(_delegate_team_members_async(root, team_id, pending_roles, ticket_id, timeout)):
+            agent = result["agent"]
+            result = _reflect_swarm_handoff(root, team_id, agent, result)
+            results[agent] = result
+            print(f"    @{agent}: {result['status']}")
 
     else:  # mixed mode
         # Run lead first, then others in parallel
         lead_member = next((m for m in team["members"] if m["role"] == lead), None)
-        other_members = [m for m in team["members"] if m["role"] != lead and m["status"] not in ("completed", "blocked")]
+        other_roles = [m["role"] for m in team["members"] if m["role"] != lead and m["status"] not in ("completed", "blocked")]
 
         # Run lead first
         if lead_member and lead_member["status"] not in ("completed", "blocked"):
@@ -719,30 +963,71 @@ def run_team_sprint(root: Path, team: Optional[dict], ticket: Optional[dict], ti
                 return results
 
         # Run others in parallel
-        if other_members:
-            print(f"    Running {len(other_members)} agents in parallel...")
-            with concurrent.futures.ThreadPoolExecutor(max_workers=len(other_members)) as executor:
-                futures = {
-                    executor.submit(delegate_team_member, root, team_id, m["role"], ticket_id, timeout): m["role"]
-                    for m in other_members
-                }
-                for future in concurrent.futures.as_completed(futures):
-                    agent = futures[future]
-                    try:
-                        result = future.result()
-                        result = _reflect_swarm_handoff(root, team_id, agent, result)
-                        results[agent] = result
-                        print(f"    @{agent}: {result['status']}")
-                    except Exception as e:
-                        results[agent] = {"agent": agent, "status": "error", "output": str(e)}
-                        print(f"    @{agent}: error - {e}")
+        if other_roles:
+            print(f"    Running {len(other_roles)} agents in parallel...")
+            for result in asyncio.run(_delegate_team_members_async(root, team_id, other_roles, ticket_id, timeout)):
+                agent = result["agent"]
+                result = _reflect_swarm_handoff(root, team_id, agent, result)
+                results[agent] = result
+                print(f"    @{agent}: {result['status']}")
 
     return results
 
 
+# Optional direct-API path for claude_prompt. The CLI (subscription auth,
+# MCP tools) stays the default; the SDK is only used when it's installed, an
+# API key is present and CTO_USE_ANTHROPIC_SDK=true opts in. The SDK (and the
+# httpx/pydantic stack behind it) is imported only once that opt-in passes, so
+# status/--help and CLI-backed sprints never pay for it.
+_SDK_MODEL_IDS = {
+    "opus": "claude-opus-4-7",
+    "opus-4-7": "claude-opus-4-7",
+    "sonnet": "claude-sonnet-4-6",
+    "sonnet-4-6": "claude-sonnet-4-6",
+    "haiku": "claude-haiku-4-5-20251001",
+}
+_SDK_MAX_TOKENS = 8192
+
+
+def _use_anthropic_sdk() -> bool:
+    return (
+        os.environ.get("CTO_USE_ANTHROPIC_SDK", "").lower() == "true"
+        and bool(os.environ.get("ANTHROPIC_API_KEY"))
+        and importlib.util.find_spec("anthropic") is not None
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _anthropic_client():
+    """One shared client per process so calls reuse its keep-alive connection."""
+    import anthropic
+    return anthropic.Anthropic(timeout=600)
+
+
+def _claude_prompt_sdk(prompt: str, model: str, thinking_budget: Optional[int]) -> str:
+    kwargs = {
+        "model": _SDK_MODEL_IDS.get(model, model),
+        "max_tokens": _SDK_MAX_TOKENS,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    if thinking_budget is not None:
+        kwargs["thinking"] = {"type": "enabled", "budget_tokens": thinking_budget}
+        kwargs["max_tokens"] = _SDK_MAX_TOKENS + thinking_budget
+    client = _anthropic_client()
+    import anthropic  # already loaded by _anthropic_client()
+    try:
+        resp = client.messages.create(**kwargs)
+    except anthropic.APIError as exc:
+        raise RuntimeError(f"Claude failed: {str(exc)[:500]}") from exc
+    return "".join(block.text for block in resp.content if block.type == "text")
+
+
 def claude_prompt(prompt: str, model: str = "opus-4-7", thinking_budget: int = None) -> str:
     """Call claude CLI directly for Rick-level genius thinking.
 
+    With CTO_USE_ANTHROPIC_SDK=true (and anthropic installed plus an API key)
+    the prompt goes through the Messages API instead, skipping the CLI fork.
+
     SECURITY NOTE: The --dangerously-skip-permissions flag is only enabled
     when the CTO_ALLOW_SKIP_PERMISSIONS environment variable is set to "true".
     """
@@ -765,6 +1050,9 @@ def claude_prompt(prompt: str, model: str = "opus-4-7", thinking_budget: int = N
             "Event logged and prompt quarantined."
         ) from exc
 
+    if _use_anthropic_sdk():
+        return _claude_prompt_sdk(safe_prompt, model, thinking_budget)
+
     cmd = ["claude", "-p", "--model", model]
 
     # SECURITY: Only skip permissions if BOTH explicit_flag=True AND env var set
@@ -834,10 +1122,50 @@ def retrieve_similar_trajectories(root: Path, query_text: str, k: int = 5) -> li
 
 # ── Plan command ────────────────────────────────────────────────────────────
 
+# Plan output is decoded with raw_decode from the first '[' — one linear pass
+# instead of a greedy DOTALL regex followed by a second json.loads.
+_JSON_ARRAY_START = re.compile(r"\[")
+_JSON_DECODER = json.JSONDecoder()
+_PARSE_ERROR_CONTEXT = 1000  # chars shown either side of a JSON parse failure
+
+
+def _extract_json_array(text: str) -> list:
+    """Decode the first non-empty JSON array of objects embedded in model output.
+
+    raw_decode runs from each '[' in turn, so a bracket in leading prose
+    ("[Note] ...") just costs a short failed attempt before the real array;
+    trailing prose after the array is ignored. Brackets inside the span an
+    earlier attempt already covered are skipped, so a malformed or truncated
+    array can't be answered by one of its own nested lists. Raises the first
+    json.JSONDecodeError if an attempt failed, else ValueError (no '[', or
+    only empty / non-object arrays).
+    """
+    first_error: Optional[json.JSONDecodeError] = None
+    covered = 0
+    for m in _JSON_ARRAY_START.finditer(text):
+        if m.start() < covered:
+            continue
+        try:
+            value, covered = _JSON_DECODER.raw_decode(text, m.start())
+        except json.JSONDecodeError as e:
+            first_error = first_error or e
+            covered = max(e.pos, m.start() + 1)
+            continue
+        if value and all(isinstance(item, dict) for item in value):
+            return value
+    if first_error is not None:
+        raise first_error
+    raise ValueError("no non-empty JSON array of objects in output")
+
+
+def _error_context(text: str, pos: int) -> str:
+    """The slice of text around pos that a parse error report should show."""
+    return text[max(0, pos - _PARSE_ERROR_CONTEXT):pos + _PARSE_ERROR_CONTEXT]
+
+
 def cmd_plan(args):
     root = find_cto_root()
     cfg = load_config(root)
-    prefix = cfg["ticket_prefix"]
     description = args.description
 
     console.print("[green]*Burrrp* Alright, let me plan this out... this is simple for a genius like me.[/green]")
@@ -920,99 +1248,32 @@ Output the JSON array now:"""
         console.print(f"[red]Error generating plan: {e}[/red]")
         sys.exit(1)
 
-    # Extract JSON from output
-    json_match = re.search(r"\[.*\]", output, re.DOTALL)
-    if not json_match:
-        console.print("[red]Error: Could not parse plan output as JSON.[/red]")
-        console.print("[dim]Raw output:[/dim]")
-        console.print(output[:2000])
-        sys.exit(1)
-
+    # Extract the ticket array from the output (surrounding prose is skipped).
+    # An empty or missing plan is a parse failure, not a zero-ticket plan.
     try:
-        plan = json.loads(json_match.group(0))
+        plan = _extract_json_array(output)
     except json.JSONDecodeError as e:
         console.print(f"[red]Error parsing JSON: {e}[/red]")
-        console.print("[dim]Raw match:[/dim]")
-        console.print(json_match.group(0)[:2000])
+        console.print("[dim]Raw output around the error:[/dim]")
+        console.print(_error_context(output, e.pos), markup=False)
         sys.exit(1)
-
-    if not isinstance(plan, list):
-        console.print("[red]Error: Plan is not a list of tickets.[/red]")
+    except ValueError:
+        console.print("[red]Error: Could not parse plan output as JSON.[/red]")
+        console.print("[dim]Raw output:[/dim]")
+        console.print(_error_context(output, 0), markup=False)
         sys.exit(1)
 
-    # Create tickets
-    created_ids = []
-    for i, item in enumerate(plan):
-        title = item.get("title", f"Ticket {i}")
-        ttype = item.get("type", "task")
-        if ttype not in ("feature", "bug", "task", "spike", "epic"):
-            ttype = "task"
-        priority = item.get("priority", "medium")
-        if priority not in ("critical", "high", "medium", "low"):
-            priority = "medium"
-        complexity = item.get("complexity", "M")
-        if complexity not in ("XS", "S", "M", "L", "XL"):
-            complexity = "M"
-
-        # Resolve parent
-        parent_idx = item.get("parent_index")
-        parent_id = None
-        if parent_idx is not None and 0 <= parent_idx < len(created_ids):
-            parent_id = created_ids[parent_idx]
-
-        # Resolve dependencies
-        dep_indices = item.get("dependency_indices") or []
-        dep_ids = []
-        for di in dep_indices:
-            if isinstance(di, int) and 0 <= di < len(created_ids):
-                dep_ids.append(created_ids[di])
-
-        criteria = item.get("acceptance_criteria") or []
-
-        # Create ticket via CLI
-        cmd_args = [
-            sys.executable, str(scripts_dir() / "ticket.py"), "create",
-            "--title", title,
-            "--type", ttype,
-            "--priority", priority,
-            "--complexity", complexity,
-            "--description", item.get("description", ""),
-        ]
-        if parent_id:
-            cmd_args.extend(["--parent", parent_id])
-        if dep_ids:
-            cmd_args.extend(["--depends", ",".join(dep_ids)])
-        if criteria:
-            cmd_args.extend(["--criteria", "|".join(criteria)])
-
-        result = subprocess.run(cmd_args, capture_output=True, text=True, cwd=str(root))
-        out = result.stdout.strip()
-        # Extract ticket ID from "Created PROJ-001: ..."
-        id_match = re.search(r"Created (\S+):", out)
-        if id_match:
-            tid = id_match.group(1)
-            created_ids.append(tid)
-            console.print(f"  [green]Created {tid}:[/green] {title}")
-        else:
-            created_ids.append(f"UNKNOWN-{i}")
-            console.print(f"  [yellow]Warning: could not parse ID from:[/yellow] {out}")
+    # Create tickets in-process in one pass: bulk_create reserves the whole
+    # ID block with a single config write and resolves parent/dependency
+    # indices through a position → id table.
+    from ticket import bulk_create
 
-    # Set all non-epic tickets to "todo" and persist provides/requires tags
-    for i, (tid, item) in enumerate(zip(created_ids, plan)):
-        try:
-            t = load_ticket(root, tid)
-            if t["type"] != "epic":
-                t["status"] = "todo"
-                t["updated_at"] = now_iso()
-            provides_tag = item.get("provides")
-            requires_tags = item.get("requires") or []
-            if provides_tag:
-                t["provides"] = provides_tag
-            if requires_tags:
-                t["requires"] = requires_tags
-            save_ticket(root, t)
-        except Exception:
-            pass
+    created_ids = bulk_create(root, plan)
+    for item, tid in zip(plan, created_ids):
+        if tid.startswith("UNKNOWN-"):
+            console.print(f"  [yellow]Warning: could not create plan item:[/yellow] {item.get('title', '')!r}")
+        else:
+            console.print(f"  [green]Created {tid}:[/green] {item.get('title', '')}")
 
     append_log(root, {
         "timestamp": now_iso(),
@@ -1146,42 +1407,206 @@ def build_sprint_context(root: Path) -> str:
 PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 
 
-def build_capability_index(root: Path) -> dict[str, str]:
+# Statuses that satisfy a dependency on the ticket holding them
+DEPENDENCY_MET_STATUSES = frozenset({"done", "in_review", "testing"})
+
+
+def _index_key(t: dict) -> tuple:
+    """The fields TicketStore indexes on; a ticket is re-indexed when these change."""
+    return (t["status"], t.get("priority"), t.get("parent_ticket"), tuple(t.get("dependencies") or ()))
+
+
+class TicketStore:
+    """In-memory indexes over every ticket, built from one all_tickets() pass.
+
+    Queries by status or parent become set lookups instead of full rescans.
+    The dependency graph is kept as a reverse index (dependents) plus a
+    per-ticket count of unmet dependencies, adjusted only for the dependents
+    of a ticket whose status flips across DEPENDENCY_MET_STATUSES — so
+    readiness never needs a full dependency walk. refresh() re-reads the
+    tickets directory and re-indexes only what changed; update() re-indexes
+    a single ticket the caller already has in hand.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.by_id: dict[str, dict] = {}
+        self.by_status: dict[str, set[str]] = {}
+        self.by_parent: dict[str, set[str]] = {}
+        self.by_priority_status: dict[tuple[str, str], set[str]] = {}
+        self.dependents: dict[str, set[str]] = {}
+        self.unmet_deps: dict[str, int] = {}
+        self._indexed: dict[str, tuple] = {}
+        for t in all_tickets(root):
+            self._index(t)
+
+    def _dep_met(self, tid: str) -> bool:
+        key = self._indexed.get(tid)
+        return key is not None and key[0] in DEPENDENCY_MET_STATUSES
+
+    def _index(self, t: dict):
+        tid = t["id"]
+        key = self._indexed[tid] = _index_key(t)
+        status, priority, parent, deps = key
+        self.by_id[tid] = t
+        self.by_status.setdefault(status, set()).add(tid)
+        self.by_priority_status.setdefault((priority, status), set()).add(tid)
+        if parent:
+            self.by_parent.setdefault(parent, set()).add(tid)
+        if status in DEPENDENCY_MET_STATUSES:
+            for c in self.dependents.get(tid, ()):
+                if c in self.unmet_deps:
+                    self.unmet_deps[c] -= 1
+        deps = set(deps)
+        for d in deps:
+            self.dependents.setdefault(d, set()).add(tid)
+        self.unmet_deps[tid] = sum(1 for d in deps if not self._dep_met(d))
+
+    def _unindex(self, tid: str):
+        """Drop tid from every index, using the fields it was indexed under
+        (callers may already have mutated the ticket dict in place)."""
+        key = self._indexed.get(tid)
+        if key is None:
+            return
+        status, priority, parent, deps = key
+        self.by_status.get(status, set()).discard(tid)
+        self.by_priority_status.get((priority, status), set()).discard(tid)
+        if parent:
+            self.by_parent.get(parent, set()).discard(tid)
+        for d in deps:
+            self.dependents.get(d, set()).discard(tid)
+        del self.unmet_deps[tid]
+        del self._indexed[tid]
+        if status in DEPENDENCY_MET_STATUSES:
+            for c in self.dependents.get(tid, ()):
+                if c in self.unmet_deps:
+                    self.unmet_deps[c] += 1
+
+    def refresh(self):
+        """Pick up tickets changed on disk since the last scan.
+
+        Unchanged files come back from the parse cache as the same dict, so
+        only new, removed, rewritten or in-place-edited tickets are
+        re-indexed (and only their dependents' counts adjusted).
+        """
+        fresh = {t["id"]: t for t in all_tickets(self.root)}
+        for tid in [tid for tid in self.by_id if tid not in fresh]:
+            self._unindex(tid)
+            del self.by_id[tid]
+        for tid, t in fresh.items():
+            if self.by_id.get(tid) is not t or self._indexed.get(tid) != _index_key(t):
+                self._unindex(tid)
+                self._index(t)
+
+    def ids_with_status(self, *statuses: str) -> set[str]:
+        return set().union(*(self.by_status.get(s, ()) for s in statuses))
+
+    def with_status(self, *statuses: str) -> list[dict]:
+        return [self.by_id[tid] for tid in sorted(self.ids_with_status(*statuses))]
+
+    def status_counts(self) -> dict[str, int]:
+        """Tickets per status, read off the status index (first-seen order)."""
+        return {status: len(ids) for status, ids in self.by_status.items() if ids}
+
+    def with_status_by_priority(self, *statuses: str) -> list[dict]:
+        """Tickets in any of statuses, in PRIORITY_ORDER then id order (no full sort).
+
+        Walks the (priority, status) buckets highest priority first; unknown
+        priorities rank last together, as PRIORITY_ORDER.get(p, 99) did.
+        """
+        wanted = set(statuses)
+        ranked: dict[int, set[str]] = {}
+        for (priority, status), ids in self.by_priority_status.items():
+            if status in wanted and ids:
+                ranked.setdefault(PRIORITY_ORDER.get(priority, 99), set()).update(ids)
+        return [self.by_id[tid] for rank in sorted(ranked) for tid in sorted(ranked[rank])]
+
+    def children(self, parent_id: str) -> list[dict]:
+        return [self.by_id[tid] for tid in sorted(self.by_parent.get(parent_id, ()))]
+
+    def update(self, t: dict):
+        """Re-index one ticket the caller just reloaded or saved."""
+        self._unindex(t["id"])
+        self._index(t)
+
+
+def build_capability_index(root: Path, store: Optional[TicketStore] = None) -> dict[str, str]:
     """Return a map of provides_tag -> ticket_id for all done tickets."""
+    store = store or TicketStore(root)
     index: dict[str, str] = {}
-    for t in all_tickets(root):
-        if t.get("status") == "done":
-            tag = t.get("provides")
-            if tag:
-                index[tag] = t["id"]
+    for t in store.with_status("done"):
+        tag = t.get("provides")
+        if tag:
+            index[tag] = t["id"]
     return index
 
 
-def get_actionable_tickets(root: Path) -> list[dict]:
+def get_actionable_tickets(root: Path, store: Optional[TicketStore] = None) -> list[dict]:
     """Get tickets that can be worked on (todo/backlog with met dependencies)."""
-    tickets = all_tickets(root)
-    done_ids = {t["id"] for t in tickets if t["status"] in ("done", "in_review", "testing")}
-    in_progress_ids = {t["id"] for t in tickets if t["status"] == "in_progress"}
-    cap_index = build_capability_index(root)
+    store = store or TicketStore(root)
+    # Dependency readiness is the store's maintained unmet-dependency count;
+    # the capability index is only built once a candidate declares requires.
+    unmet_deps = store.unmet_deps
+    cap_index: Optional[dict[str, str]] = None
 
+    # Walked in priority order, so candidates come out already ranked
     candidates = []
-    for t in tickets:
-        if t["status"] not in ("todo", "backlog"):
-            continue
+    for t in store.with_status_by_priority("todo", "backlog"):
         if t["type"] == "epic":
             continue  # epics are tracked via sub-tickets
-        deps = t.get("dependencies") or []
-        if not all(d in done_ids for d in deps):
-            continue
-        requires = t.get("requires") or []
-        if requires and not all(tag in cap_index for tag in requires):
+        if unmet_deps[t["id"]]:
             continue
+        requires = t.get("requires")
+        if requires:
+            if cap_index is None:
+                cap_index = build_capability_index(root, store)
+            if not all(tag in cap_index for tag in requires):
+                continue
         candidates.append(t)
 
-    candidates.sort(key=lambda t: PRIORITY_ORDER.get(t["priority"], 99))
     return candidates
 
 
+def select_parallel_batch(
+    candidates: list[dict],
+    max_parallel: int,
+    use_teams: bool = True,
+    budget_left_usd: Optional[float] = None,
+    est_ticket_cost_usd: float = 0.0,
+) -> list[dict]:
+    """Pick up to max_parallel solo tickets that can be delegated concurrently.
+
+    candidates is already priority-ordered and dependency-filtered, so the
+    first ticket is always included. Further tickets join only if:
+    - both they and every ticket already in the batch have a non-empty
+      files_touched (a fresh ticket's files are unknown, so it runs alone),
+      and those files don't overlap;
+    - (with teams on) they don't need a team of their own;
+    - with a sprint budget set, one more ticket at est_ticket_cost_usd still
+      fits in budget_left_usd (no estimate yet means no extra tickets).
+    """
+    batch: list[dict] = []
+    claimed: set[str] = set()
+    for t in candidates:
+        if len(batch) >= max_parallel:
+            break
+        files = set(t.get("files_touched") or [])
+        if batch:
+            if not files or files & claimed:
+                continue
+            if use_teams and (t.get("team_mode") == "collaborative" or detect_team_need(t)):
+                continue
+            if budget_left_usd is not None and (
+                est_ticket_cost_usd <= 0 or est_ticket_cost_usd * (len(batch) + 1) > budget_left_usd
+            ):
+                break
+        batch.append(t)
+        if not files:
+            break  # the first ticket's files are unknown — nothing can safely join it
+        claimed |= files
+    return batch
+
+
 def cmd_graph(args):
     root = find_cto_root()
     tickets = all_tickets(root)
@@ -1210,6 +1635,11 @@ def cmd_graph(args):
         console.print("")
 
 
+def _format_status_counts(status_counts: dict[str, int]) -> str:
+    """Render status counts as sorted "status=n" pairs for console output."""
+    return ", ".join(f"{k}={v}" for k, v in sorted(status_counts.items()))
+
+
 def cmd_sprint(args):
     root = find_cto_root()
     cfg = load_config(root)
@@ -1218,6 +1648,7 @@ def cmd_sprint(args):
     use_teams = not args.no_teams  # Enable teams by default
     smart_routing = getattr(args, 'smart_routing', False)
     resume = getattr(args, 'resume', False)
+    verbose = getattr(args, 'verbose', False)
 
     # Sprint checkpoint ledger (PROM-style resumability)
     checkpoint = load_sprint_checkpoint(root) if resume else {"tickets": {}}
@@ -1225,6 +1656,11 @@ def cmd_sprint(args):
     # Sprint cost budget
     max_sprint_cost_usd: Optional[float] = cfg.get("max_sprint_cost_usd")
     sprint_cost_usd: float = 0.0
+    costed_tickets = 0  # tickets folded into sprint_cost_usd, for a per-ticket average
+
+    # Upper bound on concurrent solo delegations per iteration. Opt-in: agents
+    # share one checkout, so the default runs one ticket at a time.
+    max_parallel = max(1, int(cfg.get("max_parallel", 1)))
 
     team_msg = " (team mode enabled)" if use_teams else " (solo mode)"
     console.print(f"[bold green]Wubba lubba dub dub! Sending the Morty's to work. (max {max_iterations} adventures){team_msg}[/bold green]")
@@ -1254,6 +1690,7 @@ def cmd_sprint(args):
     review_fail_counts: dict[str, int] = {}
     MAX_REVIEW_FAILURES = 3
 
+    store: Optional[TicketStore] = None
     while iteration < max_iterations:
         iteration += 1
         console.print(f"\n[cyan]{'═' * 60}[/cyan]")
@@ -1280,16 +1717,19 @@ def cmd_sprint(args):
             }, role="rick")
             break
 
-        # Show current status
-        tickets = all_tickets(root)
-        status_counts: dict[str, int] = {}
-        for t in tickets:
-            s = t["status"]
-            status_counts[s] = status_counts.get(s, 0) + 1
+        # Show current status. One store lives for the whole sprint; each
+        # iteration only re-indexes tickets that delegations changed on disk.
+        if store is None:
+            store = TicketStore(root)
+        else:
+            store.refresh()
+        tickets = list(store.by_id.values())
+        status_counts = store.status_counts()
         total = len(tickets)
         done = status_counts.get("done", 0)
         console.print(f"  [cyan]Progress:[/cyan] {done}/{total} done ({(done/total*100) if total else 0:.0f}%)")
-        console.print(f"  [dim]Statuses:[/dim] {json.dumps(status_counts)}")
+        if verbose:
+            console.print(f"  [dim]Statuses:[/dim] {_format_status_counts(status_counts)}")
 
         # Show active teams
         active_teams = [t for t in all_teams(root) if t["status"] == "active"]
@@ -1297,13 +1737,13 @@ def cmd_sprint(args):
             console.print(f"  [cyan]Active teams:[/cyan] {len(active_teams)}")
 
         # Check if all done
-        non_epic = [t for t in tickets if t["type"] != "epic"]
-        if all(t["status"] == "done" for t in non_epic) and non_epic:
+        non_epic_statuses = {t["status"] for t in tickets if t["type"] != "epic"}
+        if non_epic_statuses == {"done"}:
             console.print("\n  [bold green]Holy crap, the Morty's actually finished everything. I... I need a drink.[/bold green]")
             break
 
         # Get actionable tickets
-        candidates = get_actionable_tickets(root)
+        candidates = get_actionable_tickets(root, store)
         if resume:
             candidates = [
                 c for c in candidates
@@ -1311,19 +1751,40 @@ def cmd_sprint(args):
             ]
         if not candidates:
             # Check if there are in_review or testing tickets to process
-            review_tickets = [t for t in tickets if t["status"] == "in_review"]
+            review_tickets = store.with_status("in_review")
             if review_tickets:
                 console.print(f"\n  [cyan]No todo tickets, but {len(review_tickets)} in review. Let me see what the Morty's did...[/cyan]")
-                for rt in review_tickets[:3]:  # batch review
-                    console.print(f"\n  [dim]Let me see what this Morty did...[/dim] [yellow]{rt['id']}[/yellow]: {rt['title']}")
+                review_batch_tickets = review_tickets[:REVIEW_BATCH_SIZE]
+                for rt in review_batch_tickets:
                     checkpoint_ticket(root, rt["id"], "review", {"files_touched": rt.get("files_touched", [])})
-                    try:
-                        output = run_delegate(root, rt["id"], agent="reviewer-morty")
-                        console.print(f"  [dim]Review output:[/dim] {output[:200]}")
-                    except Exception as e:
-                        console.print(f"  [red]Review failed: {e}[/red]")
+                verdicts = review_batch(root, review_batch_tickets) if len(review_batch_tickets) > 1 else {}
+                # Reviews are independent: reviewer-morty passes for tickets the
+                # batch didn't cover run concurrently (bounded by
+                # review_concurrency); results are applied below in ticket order.
+                pending_ids = [rt["id"] for rt in review_batch_tickets if rt["id"] not in verdicts]
+                review_outputs: dict = {}
+                if pending_ids:
+                    review_concurrency = max(1, int(cfg.get("review_concurrency", 5)))
+                    outcomes = asyncio.run(_delegate_batch_async(
+                        root, pending_ids, review_concurrency, agent="reviewer-morty",
+                    ))
+                    review_outputs = dict(zip(pending_ids, outcomes))
+                for rt in review_batch_tickets:
+                    console.print(f"\n  [dim]Let me see what this Morty did...[/dim] [yellow]{rt['id']}[/yellow]: {rt['title']}")
+                    verdict = verdicts.get(rt["id"])
+                    if verdict is None:
+                        outcome = review_outputs.get(rt["id"])
+                        if isinstance(outcome, BaseException):
+                            console.print(f"  [red]Review failed: {outcome}[/red]")
+                        else:
+                            console.print(f"  [dim]Review output:[/dim] {outcome[:200]}")
                     # Reload ticket after review
                     rt = load_ticket(root, rt["id"])
+                    if verdict is not None:
+                        console.print(f"  [dim]Review output:[/dim] {verdict['verdict']} — {verdict['notes'][:200]}")
+                        if verdict["verdict"] == "reject" and rt["status"] == "in_review":
+                            _apply_batch_rejection(root, rt, verdict)
+                            console.print(f"  [red]{rt['id']} → This is garbage, Morty. Do it again.[/red]")
                     if rt["status"] == "in_review":
                         if _passes_quality_gate(rt):
                             if _review_and_close_ticket(root, rt):
@@ -1331,6 +1792,7 @@ def cmd_sprint(args):
                                 rt = load_ticket(root, rt["id"])
                                 checkpoint_ticket(root, rt["id"], "done", {"files_touched": rt.get("files_touched", [])})
                                 sprint_cost_usd += _estimate_ticket_cost_usd(rt, cfg.get("default_model", "sonnet"))
+                                costed_tickets += 1
                                 append_log(root, {
                                     "timestamp": now_iso(),
                                     "ticket_id": rt["id"],
@@ -1372,8 +1834,8 @@ def cmd_sprint(args):
                 continue
 
             # Check blocked
-            blocked = [t for t in tickets if t["status"] == "blocked"]
-            in_progress = [t for t in tickets if t["status"] == "in_progress"]
+            blocked = store.with_status("blocked")
+            in_progress = store.with_status("in_progress")
             if blocked and not in_progress:
                 console.print(f"\n  [red]Every Morty is stuck. This is what I get for relying on Morty's. ({len(blocked)} blocked)[/red]")
                 for bt in blocked:
@@ -1420,6 +1882,7 @@ def cmd_sprint(args):
                                 t = load_ticket(root, tid)
                                 checkpoint_ticket(root, tid, "done", {"files_touched": t.get("files_touched", [])})
                                 sprint_cost_usd += _estimate_ticket_cost_usd(t, cfg.get("default_model", "sonnet"))
+                                costed_tickets += 1
                                 console.print(f"  [green]{t['id']} → done. Good enough. Approved. *burp*[/green]")
                             else:
                                 t = load_ticket(root, tid)
@@ -1436,7 +1899,8 @@ def cmd_sprint(args):
                     }
                     update_sprint_state(root, t, parsed_for_sprint, result.get("agent", "unknown"))
                     if t.get("parent_ticket"):
-                        update_epic_status(root, t["parent_ticket"])
+                        store.update(t)
+                        update_epic_status(root, t["parent_ticket"], store)
                 except Exception:
                     pass
 
@@ -1477,7 +1941,21 @@ def cmd_sprint(args):
             if not team_template:
                 team_template = detect_team_need(ticket)
 
-        checkpoint_ticket(root, ticket["id"], "delegate", {"team_template": team_template})
+        # Independent solo tickets (known, disjoint files; no team needed) go out together
+        if team_template:
+            batch = [ticket]
+        else:
+            budget_left = None if max_sprint_cost_usd is None else max_sprint_cost_usd - sprint_cost_usd
+            batch = select_parallel_batch(
+                candidates, max_parallel, use_teams,
+                budget_left_usd=budget_left,
+                est_ticket_cost_usd=sprint_cost_usd / costed_tickets if costed_tickets else 0.0,
+            )
+        for extra in batch[1:]:
+            console.print(f"  [bold yellow]You too, Morty![/bold yellow] [yellow]{extra['id']}[/yellow]: {extra['title']}")
+
+        for bt in batch:
+            checkpoint_ticket(root, bt["id"], "delegate", {"team_template": team_template})
 
         if team_template:
             # Team collaboration mode
@@ -1524,77 +2002,86 @@ def cmd_sprint(args):
                 except Exception as e2:
                     console.print(f"  [red]Solo delegation also failed: {e2}[/red]")
         else:
-            # Solo mode (original behavior)
-            try:
-                output = run_delegate(root, ticket["id"], timeout=600, smart_routing=smart_routing)
-                console.print(f"  [dim]Delegate output (last 300 chars): ...{output[-300:]}[/dim]")
-            except subprocess.TimeoutExpired:
-                console.print(f"  [red]Delegation timed out for {ticket['id']}[/red]")
-                t = load_ticket(root, ticket["id"])
-                t["status"] = "blocked"
-                t["blocked_reason"] = "timeout"
-                t["review_notes"] = "TIMEOUT: Agent timed out. Consider splitting this ticket."
-                t["updated_at"] = now_iso()
-                # Preserve any session_id saved by delegate.py before the kill so --resume still works
-                save_ticket(root, t)
-            except Exception as e:
-                console.print(f"  [red]Delegation error: {e}[/red]")
-
-        # Check if ticket ended up in_review — quality gate before auto-approve
-        t = load_ticket(root, ticket["id"])
-        if t["status"] == "in_review":
-            checkpoint_ticket(root, t["id"], "review", {"files_touched": t.get("files_touched", [])})
-            if _passes_quality_gate(t):
-                files_touched = t.get("files_touched", [])
-                if _review_and_close_ticket(root, t):
-                    t = load_ticket(root, ticket["id"])
-                    checkpoint_ticket(root, t["id"], "done", {"files_touched": files_touched})
-                    sprint_cost_usd += _estimate_ticket_cost_usd(t, cfg.get("default_model", "sonnet"))
-                    append_log(root, {
-                        "timestamp": now_iso(),
-                        "ticket_id": t["id"],
-                        "agent": "rick",
-                        "action": "completed",
-                        "message": f"Good enough. Approved. *burp* {t['title']}",
-                        "files_changed": files_touched,
-                    })
-                    console.print(f"  [green]{t['id']} → done. Good enough. Approved. *burp*[/green]")
+            # Solo mode — the whole batch is delegated concurrently
+            if len(batch) > 1:
+                console.print(f"    [cyan]{len(batch)} independent tickets, running up to {max_parallel} in parallel...[/cyan]")
+            outcomes = asyncio.run(_delegate_batch_async(
+                root, [bt["id"] for bt in batch], max_parallel, timeout=600, smart_routing=smart_routing,
+            ))
+            for bt, outcome in zip(batch, outcomes):
+                if isinstance(outcome, subprocess.TimeoutExpired):
+                    console.print(f"  [red]Delegation timed out for {bt['id']}[/red]")
+                    t = load_ticket(root, bt["id"])
+                    t["status"] = "blocked"
+                    t["blocked_reason"] = "timeout"
+                    t["review_notes"] = "TIMEOUT: Agent timed out. Consider splitting this ticket."
+                    t["updated_at"] = now_iso()
+                    # Preserve any session_id saved by delegate.py before the kill so --resume still works
+                    save_ticket(root, t)
+                elif isinstance(outcome, BaseException):
+                    console.print(f"  [red]Delegation error ({bt['id']}): {outcome}[/red]")
                 else:
-                    t = load_ticket(root, ticket["id"])
-            else:
-                console.print(
-                    f"  [yellow]{t['id']} → quality gate failed (missing files_changed or description) — "
-                    f"left in_review for manual review.[/yellow]"
-                )
-
-        # Update sprint state with accumulated context (PROM-008)
-        parsed_for_sprint = {
-            "status": t["status"],
-            "files_changed": t.get("files_touched", []),
-            "description": t.get("agent_output", ""),
-            "open_questions": t.get("review_notes", ""),
-        }
-        agent_used = t.get("assigned_agent", "unknown")
-        update_sprint_state(root, t, parsed_for_sprint, agent_used)
+                    prefix = f"[{bt['id']}] " if len(batch) > 1 else ""
+                    console.print(f"  [dim]{prefix}Delegate output (last 300 chars): ...{outcome[-300:]}[/dim]")
+
+        for ticket in batch:
+            # Check if ticket ended up in_review — quality gate before auto-approve
+            t = load_ticket(root, ticket["id"])
+            if t["status"] == "in_review":
+                checkpoint_ticket(root, t["id"], "review", {"files_touched": t.get("files_touched", [])})
+                if _passes_quality_gate(t):
+                    files_touched = t.get("files_touched", [])
+                    if _review_and_close_ticket(root, t):
+                        t = load_ticket(root, ticket["id"])
+                        checkpoint_ticket(root, t["id"], "done", {"files_touched": files_touched})
+                        sprint_cost_usd += _estimate_ticket_cost_usd(t, cfg.get("default_model", "sonnet"))
+                        costed_tickets += 1
+                        append_log(root, {
+                            "timestamp": now_iso(),
+                            "ticket_id": t["id"],
+                            "agent": "rick",
+                            "action": "completed",
+                            "message": f"Good enough. Approved. *burp* {t['title']}",
+                            "files_changed": files_touched,
+                        })
+                        console.print(f"  [green]{t['id']} → done. Good enough. Approved. *burp*[/green]")
+                    else:
+                        t = load_ticket(root, ticket["id"])
+                else:
+                    console.print(
+                        f"  [yellow]{t['id']} → quality gate failed (missing files_changed or description) — "
+                        f"left in_review for manual review.[/yellow]"
+                    )
+
+            # Update sprint state with accumulated context (PROM-008)
+            parsed_for_sprint = {
+                "status": t["status"],
+                "files_changed": t.get("files_touched", []),
+                "description": t.get("agent_output", ""),
+                "open_questions": t.get("review_notes", ""),
+            }
+            agent_used = t.get("assigned_agent", "unknown")
+            update_sprint_state(root, t, parsed_for_sprint, agent_used)
 
-        # Update parent epic if applicable
-        if t.get("parent_ticket"):
-            update_epic_status(root, t["parent_ticket"])
+            # Update parent epic if applicable
+            if t.get("parent_ticket"):
+                store.update(t)
+                update_epic_status(root, t["parent_ticket"], store)
 
     # Sprint summary
     console.print(f"\n[cyan]{'═' * 60}[/cyan]")
     console.print(f"  [bold cyan]Adventure Complete — {iteration} adventures[/bold cyan]")
     console.print(f"[cyan]{'═' * 60}[/cyan]")
-    tickets = all_tickets(root)
-    status_counts = {}
-    for t in tickets:
-        s = t["status"]
-        status_counts[s] = status_counts.get(s, 0) + 1
-    total = len(tickets)
+    if store is None:
+        store = TicketStore(root)
+    else:
+        store.refresh()
+    status_counts = store.status_counts()
+    total = len(store.by_id)
     done = status_counts.get("done", 0)
     pct = (done/total*100) if total else 0
     console.print(f"  [cyan]Final:[/cyan] {done}/{total} done ({pct:.0f}%)")
-    console.print(f"  [dim]Statuses:[/dim] {json.dumps(status_counts)}")
+    console.print(f"  [dim]Statuses:[/dim] {_format_status_counts(status_counts)}")
     if pct == 100:
         console.print("  [bold green]*Rick takes a swig from his flask* That's how it's done. I'm a genius.[/bold green]")
     elif pct >= 75:
@@ -1637,21 +2124,33 @@ def cmd_sprint(args):
     flush_events()
 
 
-def update_epic_status(root: Path, epic_id: str):
-    """Update epic status based on sub-ticket completion."""
+def update_epic_status(root: Path, epic_id: str, store: TicketStore):
+    """Update epic status based on sub-ticket completion.
+
+    Children come from the sprint's store, so the caller re-indexes the child
+    it just reloaded (store.update) before calling.
+    """
+    # Both sprint call sites run on the main thread, so there is no in-process
+    # race; the flock only keeps a second orchestrate process (another sprint
+    # or CLI run on the same project) from interleaving its own epic update.
+    with _cto_lock(root):
+        _update_epic_status_locked(root, epic_id, store)
+
+
+def _update_epic_status_locked(root: Path, epic_id: str, store: TicketStore):
     try:
         epic = load_ticket(root, epic_id)
     except Exception:
         return
 
-    tickets = all_tickets(root)
-    children = [t for t in tickets if t.get("parent_ticket") == epic_id]
+    children = store.children(epic_id)
     if not children:
         return
 
     old_status = epic["status"]
-    all_done = all(c["status"] == "done" for c in children)
-    any_in_progress = any(c["status"] in ("in_progress", "in_review", "testing") for c in children)
+    child_counts = Counter(c["status"] for c in children)
+    all_done = child_counts.keys() == {"done"}
+    any_in_progress = any(child_counts[s] for s in ("in_progress", "in_review", "testing"))
 
     if all_done:
         epic["status"] = "done"
@@ -1660,10 +2159,11 @@ def update_epic_status(root: Path, epic_id: str):
         epic["status"] = "in_progress"
     epic["updated_at"] = now_iso()
     save_ticket(root, epic)
+    store.update(epic)
 
     # Emit cto.project.epic.status.changed event if status changed
     if epic["status"] != old_status:
-        done_count = sum(1 for c in children if c["status"] == "done")
+        done_count = child_counts["done"]
         emit("cto.project.epic.status.changed", {
             "epic_id": epic_id,
             "title": epic.get("title"),
@@ -1678,6 +2178,7 @@ def update_epic_status(root: Path, epic_id: str):
 
 def cmd_review(args):
     root = find_cto_root()
+    cfg = load_config(root)
     tickets = all_tickets(root)
     review_tickets = [t for t in tickets if t["status"] == "in_review"]
 
@@ -1687,16 +2188,39 @@ def cmd_review(args):
 
     console.print(f"[cyan]*Squints* Reviewing {len(review_tickets)} tickets from the Morty's...[/cyan]")
 
+    # One batched review call per REVIEW_BATCH_SIZE tickets; anything the
+    # batch didn't cover falls back to a reviewer-morty delegation below.
+    verdicts = review_batch(root, review_tickets) if len(review_tickets) > 1 else {}
+
+    # Reviews are independent: run the reviewer-morty fallbacks concurrently,
+    # bounded by review_concurrency, then apply results in ticket order.
+    pending_ids = [t["id"] for t in review_tickets if t["id"] not in verdicts]
+    review_outputs: dict = {}
+    if pending_ids:
+        review_concurrency = max(1, int(cfg.get("review_concurrency", 5)))
+        if len(pending_ids) > 1:
+            console.print(f"[dim]Running {len(pending_ids)} reviewer-morty passes, up to {review_concurrency} at a time...[/dim]")
+        outcomes = asyncio.run(_delegate_batch_async(
+            root, pending_ids, review_concurrency, agent="reviewer-morty",
+        ))
+        review_outputs = dict(zip(pending_ids, outcomes))
+
     for t in review_tickets:
         console.print(f"\n  [dim]*Squints* Let me look at what Morty #[/dim][yellow]{t['id']}[/yellow] cooked up...")
-        try:
-            output = run_delegate(root, t["id"], agent="reviewer-morty")
-            console.print(f"  [dim]Review result:[/dim] {output[:300]}")
-        except Exception as e:
-            console.print(f"  [red]Review failed: {e}[/red]")
+        verdict = verdicts.get(t["id"])
+        if verdict is None:
+            outcome = review_outputs.get(t["id"])
+            if isinstance(outcome, BaseException):
+                console.print(f"  [red]Review failed: {outcome}[/red]")
+            else:
+                console.print(f"  [dim]Review result:[/dim] {outcome[:300]}")
 
         # Reload ticket
         t = load_ticket(root, t["id"])
+        if verdict is not None:
+            console.print(f"  [dim]Review result:[/dim] {verdict['verdict']} — {verdict['notes'][:300]}")
+            if verdict["verdict"] == "reject" and t["status"] == "in_review":
+                _apply_batch_rejection(root, t, verdict)
         if t["status"] == "in_review":
             # Reviewer didn't change status → approve
             t["status"] = "done"
@@ -1721,16 +2245,37 @@ def cmd_review(args):
 
 # ── Status command ──────────────────────────────────────────────────────────
 
+def _read_last_line(fp: Path, block: int = 4096) -> Optional[str]:
+    """Return the last non-empty line of fp, reading only its tail.
+
+    Seeks back block bytes at a time until a complete line is in hand, so a
+    busy day's log costs one small read rather than a full readlines().
+    """
+    with open(fp, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        start = size
+        tail = b""
+        while start > 0:
+            start = max(0, start - block)
+            f.seek(start)
+            tail = f.read(size - start)
+            stripped = tail.rstrip(b"\r\n")
+            if start == 0 or b"\n" in stripped:
+                break
+        lines = [ln for ln in tail.split(b"\n") if ln.strip()]
+        if not lines:
+            return None
+        return lines[-1].decode("utf-8", errors="replace").strip()
+
+
 def cmd_status(args):
     root = find_cto_root()
     cfg = load_config(root)
-    tickets = all_tickets(root)
+    store = TicketStore(root)
+    tickets = list(store.by_id.values())
     project_name = cfg.get("project_name", "Unknown")
 
-    status_counts: dict[str, int] = {}
-    for t in tickets:
-        s = t["status"]
-        status_counts[s] = status_counts.get(s, 0) + 1
+    status_counts = store.status_counts()
 
     total = len(tickets)
     done = status_counts.get("done", 0)
@@ -1746,12 +2291,11 @@ def cmd_status(args):
             (p for p in ld.glob("*.jsonl") if p.stem[:1].isdigit()), reverse=True
         )
         if log_files:
-            with open(log_files[0]) as f:
-                lines = f.readlines()
-                if lines:
-                    last = json.loads(lines[-1].strip())
-                    msg = last.get("message") or last.get("note") or last.get("action", "")
-                    last_activity = f"{last['timestamp'][:19]} — {msg[:40]}"
+            last_line = _read_last_line(log_files[0])
+            if last_line:
+                last = json.loads(last_line)
+                msg = last.get("message") or last.get("note") or last.get("action", "")
+                last_activity = f"{last['timestamp'][:19]} — {msg[:40]}"
 
     backlog = status_counts.get("backlog", 0)
     todo = status_counts.get("todo", 0)
@@ -1782,18 +2326,22 @@ def cmd_status(args):
     ))
     console.print(status_table)
 
-    from rich.progress import BarColumn, Progress, TextColumn as _TC
-    with Progress(
-        _TC("[progress.description]{task.description}"),
-        BarColumn(bar_width=40, style="green", complete_style="bright_green"),
-        _TC("[cyan]{task.percentage:>3.0f}%[/cyan]"),
-        console=console,
-        transient=False,
-    ) as prog:
-        prog.add_task(f"[cyan]Morty Progress ({done}/{total})[/cyan]", total=100, completed=pct)
+    if console.is_terminal:
+        from rich.progress import BarColumn, Progress, TextColumn as _TC
+        with Progress(
+            _TC("[progress.description]{task.description}"),
+            BarColumn(bar_width=40, style="green", complete_style="bright_green"),
+            _TC("[cyan]{task.percentage:>3.0f}%[/cyan]"),
+            console=console,
+            transient=False,
+        ) as prog:
+            prog.add_task(f"[cyan]Morty Progress ({done}/{total})[/cyan]", total=100, completed=pct)
+    else:
+        # Piped/CI output: skip the live progress renderer, one plain line is enough
+        console.print(f"Morty Progress ({done}/{total}): {pct:.0f}%")
 
     # Capability tag summary
-    cap_index = build_capability_index(root)
+    cap_index = build_capability_index(root, store)
     all_requires = [tag for t in tickets for tag in (t.get("requires") or [])]
     produced = len(cap_index)
     required = len(set(all_requires))
@@ -1843,6 +2391,7 @@ def build_parser():
     sp.add_argument("--no-teams", action="store_true", help="Disable team collaboration (solo mode only)")
     sp.add_argument("--smart-routing", action="store_true", help="Use Haiku-powered smart routing for agent selection and complexity estimation")
     sp.add_argument("--resume", action="store_true", help="Resume from the last sprint checkpoint, skipping tickets already checkpointed done")
+    sp.add_argument("--verbose", action="store_true", help="Print the per-status ticket counts every iteration")
 
     # review
     sub.add_parser("review", help="Review all completed tickets")
@@ -13,6 +13,23 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+# orjson is an optional speedup for the log and ticket JSON paths; stdlib json
+# is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_line(entry: dict) -> bytes:
+    """One compact JSONL line (orjson when available), newline included."""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry) + "\n").encode()
+
+
 # ── Progress display ─────────────────────────────────────────────────────────
 
 _REDRAW_INTERVAL = 0.1  # seconds — minimum gap between terminal repaints
@@ -163,19 +180,19 @@ def now_iso() -> str:
 
 def append_log(root: Path, entry: dict):
     fp = today_log_file(root)
-    with open(fp, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    with open(fp, "ab") as f:
+        f.write(_json_line(entry))
 
 
 def read_all_logs(root: Path) -> list[dict]:
     ld = logs_dir(root)
     entries = []
     for fp in sorted(ld.glob("*.jsonl")):
-        with open(fp) as f:
+        with open(fp, "rb") as f:
             for line in f:
                 line = line.strip()
                 if line:
-                    entries.append(json.loads(line))
+                    entries.append(_json_loads(line))
     return entries
 
 
@@ -184,11 +201,11 @@ def read_today_logs(root: Path) -> list[dict]:
     if not fp.exists():
         return []
     entries = []
-    with open(fp) as f:
+    with open(fp, "rb") as f:
         for line in f:
             line = line.strip()
             if line:
-                entries.append(json.loads(line))
+                entries.append(_json_loads(line))
     return entries
 
 
@@ -196,11 +213,7 @@ def load_all_tickets(root: Path) -> list[dict]:
     td = root / ".cto" / "tickets"
     if not td.exists():
         return []
-    tickets = []
-    for fp in sorted(td.glob("*.json")):
-        with open(fp) as f:
-            tickets.append(json.load(f))
-    return tickets
+    return [_json_loads(fp.read_bytes()) for fp in sorted(td.glob("*.json"))]
 
 
 # ── Commands ────────────────────────────────────────────────────────────────
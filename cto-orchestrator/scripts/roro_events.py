@@ -21,13 +21,9 @@ import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import wraps
-from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-# Try to import urllib.request for HTTP without external dependencies
-import urllib.error
-import urllib.request
 import atexit
 
 try:
@@ -260,62 +256,79 @@ def _push_to_sse(payload: dict):
             _sse_clients.remove(q)
 
 
-class _SSEHandler(BaseHTTPRequestHandler):
-    """HTTP handler for SSE connections on /events."""
+def _sse_handler_class():
+    """Build the SSE request handler on first use.
 
-    def log_message(self, format, *args):  # noqa: A002
-        """Suppress default per-request logging."""
-        pass
+    http.server (and the email/socket stack it drags in) is only imported
+    once an SSE server actually starts, so scripts that merely emit events —
+    or just print --help — don't pay for it at import time.
+    """
+    global _SSEHandler
+    if _SSEHandler is not None:
+        return _SSEHandler
+    from http.server import BaseHTTPRequestHandler
 
-    def do_GET(self):
-        if self.path != "/events":
-            self.send_response(404)
-            self.end_headers()
-            return
+    class _SSEHandler(BaseHTTPRequestHandler):
+        """HTTP handler for SSE connections on /events."""
 
-        self.send_response(200)
-        self.send_header("Content-Type", "text/event-stream")
-        self.send_header("Cache-Control", "no-cache")
-        self.send_header("Connection", "keep-alive")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
+        def log_message(self, format, *args):  # noqa: A002
+            """Suppress default per-request logging."""
+            pass
 
-        # Replay events missed since Last-Event-ID
-        last_id_str = self.headers.get("Last-Event-ID", "")
-        last_id = int(last_id_str) if last_id_str.isdigit() else 0
+        def do_GET(self):
+            if self.path != "/events":
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "keep-alive")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
 
-        with _sse_buffer_lock:
-            missed = [(eid, fmt) for eid, fmt in _sse_event_buffer if eid > last_id]
+            # Replay events missed since Last-Event-ID
+            last_id_str = self.headers.get("Last-Event-ID", "")
+            last_id = int(last_id_str) if last_id_str.isdigit() else 0
 
-        try:
-            for _, fmt in missed:
-                self.wfile.write(fmt)
-            self.wfile.flush()
-        except (BrokenPipeError, ConnectionResetError, OSError):
-            return
+            with _sse_buffer_lock:
+                missed = [(eid, fmt) for eid, fmt in _sse_event_buffer if eid > last_id]
 
-        client_q: queue.Queue = queue.Queue(maxsize=100)
-        with _sse_clients_lock:
-            _sse_clients.append(client_q)
+            try:
+                for _, fmt in missed:
+                    self.wfile.write(fmt)
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError, OSError):
+                return
 
-        try:
-            while True:
-                try:
-                    data = client_q.get(timeout=15.0)
-                    self.wfile.write(data)
-                    self.wfile.flush()
-                except queue.Empty:
-                    # Keepalive comment to detect dead connections
-                    self.wfile.write(b": keepalive\n\n")
-                    self.wfile.flush()
-        except (BrokenPipeError, ConnectionResetError, OSError):
-            pass
-        finally:
+            client_q: queue.Queue = queue.Queue(maxsize=100)
             with _sse_clients_lock:
-                try:
-                    _sse_clients.remove(client_q)
-                except ValueError:
-                    pass
+                _sse_clients.append(client_q)
+
+            try:
+                while True:
+                    try:
+                        data = client_q.get(timeout=15.0)
+                        self.wfile.write(data)
+                        self.wfile.flush()
+                    except queue.Empty:
+                        # Keepalive comment to detect dead connections
+                        self.wfile.write(b": keepalive\n\n")
+                        self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError, OSError):
+                pass
+            finally:
+                with _sse_clients_lock:
+                    try:
+                        _sse_clients.remove(client_q)
+                    except ValueError:
+                        pass
+
+    return _SSEHandler
+
+
+_SSEHandler = None
 
 
 class _SSEServerWrapper:
@@ -323,12 +336,13 @@ class _SSEServerWrapper:
 
     def __init__(self, port: int):
         self.port = port
-        self._server: Optional[HTTPServer] = None
+        self._server = None  # http.server.HTTPServer once started
         self._thread: Optional[threading.Thread] = None
 
     def start(self):
         try:
-            self._server = HTTPServer(("localhost", self.port), _SSEHandler)
+            from http.server import HTTPServer
+            self._server = HTTPServer(("localhost", self.port), _sse_handler_class())
             self._thread = threading.Thread(
                 target=self._server.serve_forever,
                 daemon=True,
@@ -396,6 +410,11 @@ def get_agent_id(role: str, team_id: Optional[str] = None) -> str:
 
 def _send_event(endpoint: str, payload: dict, timeout: float, verbose: bool):
     """Send event via HTTP POST (runs in background thread)."""
+    # Imported here rather than at module load: most runs never POST (no
+    # endpoint configured), and urllib.request pulls in http.client/ssl.
+    import urllib.error
+    import urllib.request
+
     try:
         data = json.dumps(payload).encode("utf-8")
         req = urllib.request.Request(
@@ -133,6 +133,14 @@ _JSON_XML_TAG_RE = re.compile(r"<result_json>\s*(\{.*?\})\s*</result_json>", re.
 _JSON_FENCE_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
 # Fallback: bare JSON object
 _JSON_BARE_RE = re.compile(r'(\{"status"\s*:.*?\})', re.DOTALL)
+# Meeseeks escalation phrase, matched case-insensitively without upper()-copying the output
+_EXISTENCE_IS_PAIN_RE = re.compile(r"EXISTENCE IS PAIN", re.IGNORECASE)
+# (literal marker, pattern) in preference order for extract_json_block()
+_JSON_BLOCK_FORMS = (
+    ("<result_json>", _JSON_XML_TAG_RE),
+    ("```json", _JSON_FENCE_RE),
+    ('{"status"', _JSON_BARE_RE),
+)
 
 
 def extract_json_block(output: str) -> Optional[dict]:
@@ -147,35 +155,19 @@ def extract_json_block(output: str) -> Optional[dict]:
     if not output:
         return None
 
-    # Try XML-tagged form first (unambiguous delimiter)
-    match = _JSON_XML_TAG_RE.search(output)
-    if match:
-        try:
-            data = json.loads(match.group(1))
-            if isinstance(data, dict) and "status" in data:
-                return data
-        except json.JSONDecodeError:
-            pass
-
-    # Try fenced JSON
-    match = _JSON_FENCE_RE.search(output)
-    if match:
-        try:
-            data = json.loads(match.group(1))
-            if isinstance(data, dict) and "status" in data:
-                return data
-        except json.JSONDecodeError:
-            pass
-
-    # Try bare JSON with "status" key
-    match = _JSON_BARE_RE.search(output)
-    if match:
-        try:
-            data = json.loads(match.group(1))
-            if isinstance(data, dict) and "status" in data:
-                return data
-        except json.JSONDecodeError:
-            pass
+    # Same parse/validate for every form, in preference order; the literal
+    # marker check skips a form's regex scan when the output can't contain it.
+    for marker, pattern in _JSON_BLOCK_FORMS:
+        if marker not in output:
+            continue
+        match = pattern.search(output)
+        if match:
+            try:
+                data = json.loads(match.group(1))
+                if isinstance(data, dict) and "status" in data:
+                    return data
+            except json.JSONDecodeError:
+                pass
 
     return None
 
@@ -239,7 +231,7 @@ def parse_meeseeks_json(output: str) -> Optional[MeeseeksOutput]:
         MeeseeksOutput if JSON was found and valid, None otherwise.
     """
     # Check for EXISTENCE IS PAIN first
-    if "EXISTENCE IS PAIN" in output.upper():
+    if _EXISTENCE_IS_PAIN_RE.search(output):
         return MeeseeksOutput(
             status="too_complex",
             existence_is_pain=True,
@@ -11,6 +11,7 @@ Teams enable:
 """
 
 import argparse
+import fcntl
 import json
 import os
 import re
@@ -19,6 +20,25 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+# orjson is an optional speedup for the team/context/message JSON paths; stdlib json
+# is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_bytes(data, indent: bool = True) -> bytes:
+    """Serialize *data* to UTF-8 JSON bytes, 2-space indented unless indent=False."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data).encode()
+
+
 # Import roro event emitter
 try:
     from roro_events import emit
@@ -78,14 +98,12 @@ def now_iso() -> str:
 
 
 def load_json(fp: Path) -> dict:
-    with open(fp) as f:
-        return json.load(f)
+    return _json_loads(fp.read_bytes())
 
 
 def save_json(fp: Path, data: dict):
     fp.parent.mkdir(parents=True, exist_ok=True)
-    with open(fp, "w") as f:
-        json.dump(data, f, indent=2)
+    fp.write_bytes(_json_bytes(data))
 
 
 def load_config(root: Path) -> dict:
@@ -186,7 +204,7 @@ def create_team_session(
     ensure_team_dirs(root)
 
     team_id = next_team_id(root)
-    template = get_template(template_name)
+    template = get_template(template_name, root)
 
     if template is None and custom_roles is None:
         print(f"Error: Unknown template '{template_name}' and no custom roles provided.", file=sys.stderr)
@@ -351,9 +369,30 @@ def load_shared_context(root: Path, team_id: str) -> dict:
     return load_json(fp)
 
 
+# Shared team context keeps only the newest entries of each list inline; older
+# ones move to an append-only {team_id}-{kind}.jsonl beside it, so the JSON every
+# delegation re-parses stops growing with session age while history is kept.
+SHARED_CONTEXT_KEEP = 50
+
+
+def archive_context_overflow(ctx_dir: Path, team_id: str, context: dict):
+    """Move all but the last SHARED_CONTEXT_KEEP entries of each list to JSONL.
+
+    Used by save_shared_context here and by delegate.process_team_output.
+    """
+    for kind in ("decisions", "interfaces", "notes", "artifacts"):
+        entries = context.get(kind)
+        if not entries or len(entries) <= SHARED_CONTEXT_KEEP:
+            continue
+        with open(ctx_dir / f"{team_id}-{kind}.jsonl", "ab") as f:
+            f.write(b"".join(_json_bytes(entry, indent=False) + b"\n" for entry in entries[:-SHARED_CONTEXT_KEEP]))
+        del entries[:-SHARED_CONTEXT_KEEP]
+
+
 def save_shared_context(root: Path, team_id: str, context: dict):
-    """Save shared context for a team."""
+    """Save shared context for a team, archiving overflow entries to JSONL."""
     context["updated_at"] = now_iso()
+    archive_context_overflow(context_dir(root), team_id, context)
     fp = context_dir(root) / f"{team_id}-shared.json"
     save_json(fp, context)
 
@@ -407,11 +446,30 @@ def add_note(root: Path, team_id: str, note: str, author: str):
 
 # ── Inter-Agent Messages ─────────────────────────────────────────────────────
 
+def reserve_message_numbers(msg_dir: Path, count: int = 1) -> int:
+    """Reserve *count* consecutive message numbers for a team; return the first.
+
+    The last issued number lives in msg_dir/.counter so senders don't glob
+    every msg-*.json just to count them; a missing counter is seeded once from
+    the existing files. flock serializes delegate.py, team.py and the MCP
+    server when they send concurrently.
+    """
+    with open(msg_dir / ".counter", "a+") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.seek(0)
+        raw = f.read().strip()
+        last = int(raw) if raw.isdigit() else len(list(msg_dir.glob("msg-*.json")))
+        f.seek(0)
+        f.truncate()
+        f.write(str(last + count))
+    return last + 1
+
+
 def next_message_id(root: Path, team_id: str) -> str:
     """Generate next message ID for a team."""
     msg_dir = messages_dir(root) / team_id
-    existing = list(msg_dir.glob("msg-*.json"))
-    num = len(existing) + 1
+    msg_dir.mkdir(parents=True, exist_ok=True)
+    num = reserve_message_numbers(msg_dir)
     return f"msg-{num:03d}"
 
 
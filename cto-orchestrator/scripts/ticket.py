@@ -15,6 +15,25 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+# orjson is an optional speedup for the ticket/config JSON paths; stdlib json
+# is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_bytes(data, indent: bool = True) -> bytes:
+    """Serialize *data* to UTF-8 JSON bytes, 2-space indented unless indent=False."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data).encode()
+
+
 # Import roro event emitter
 try:
     from roro_events import emit
@@ -79,13 +98,11 @@ def load_config(root: Path) -> dict:
     if not cp.exists():
         print(f"Error: {cp} not found.", file=sys.stderr)
         sys.exit(1)
-    with open(cp) as f:
-        return json.load(f)
+    return _json_loads(cp.read_bytes())
 
 
 def save_config(root: Path, cfg: dict):
-    with open(config_path(root), "w") as f:
-        json.dump(cfg, f, indent=2)
+    config_path(root).write_bytes(_json_bytes(cfg))
 
 
 def next_ticket_id(root: Path) -> str:
@@ -110,8 +127,7 @@ def load_ticket(root: Path, ticket_id: str) -> dict:
     if not fp.exists():
         print(f"Error: Ticket {safe_id} not found.", file=sys.stderr)
         sys.exit(1)
-    with open(fp) as f:
-        return json.load(f)
+    return _json_loads(fp.read_bytes())
 
 
 def save_ticket(root: Path, ticket: dict):
@@ -124,19 +140,14 @@ def save_ticket(root: Path, ticket: dict):
         print(f"Error: Invalid ticket ID: {e}", file=sys.stderr)
         sys.exit(1)
     fp = td / f"{safe_id}.json"
-    with open(fp, "w") as f:
-        json.dump(ticket, f, indent=2)
+    fp.write_bytes(_json_bytes(ticket))
 
 
 def all_tickets(root: Path) -> list[dict]:
     td = tickets_dir(root)
     if not td.exists():
         return []
-    tickets = []
-    for fp in sorted(td.glob("*.json")):
-        with open(fp) as f:
-            tickets.append(json.load(f))
-    return tickets
+    return [_json_loads(fp.read_bytes()) for fp in sorted(td.glob("*.json"))]
 
 
 def now_iso() -> str:
@@ -156,9 +167,12 @@ STOPWORDS = {
 }
 
 
+_WORD_SPLIT_RE = re.compile(r'\W+')
+
+
 def extract_keywords(text: str) -> list[str]:
     """Extract top-30 unique keywords from text by frequency."""
-    tokens = re.split(r'\W+', (text or "").lower())
+    tokens = _WORD_SPLIT_RE.split((text or "").lower())
     freq: dict[str, int] = {}
     for tok in tokens:
         if len(tok) >= 4 and tok not in STOPWORDS:
@@ -194,8 +208,7 @@ def write_trajectory(root: Path, ticket: dict) -> None:
         "keywords": extract_keywords(combined_text),
     }
     fp = tdir / f"{tid}.json"
-    with open(fp, "w") as f:
-        json.dump(record, f, indent=2)
+    fp.write_bytes(_json_bytes(record))
 
 
 def cmd_trajectories(args):
@@ -204,10 +217,7 @@ def cmd_trajectories(args):
     if not tdir.exists():
         print("No trajectories yet. Close some tickets first, Morty.")
         return
-    records = []
-    for fp in sorted(tdir.glob("*.json")):
-        with open(fp) as f:
-            records.append(json.load(f))
+    records = [_json_loads(fp.read_bytes()) for fp in sorted(tdir.glob("*.json"))]
     if not records:
         print("No trajectories yet. Close some tickets first, Morty.")
         return
@@ -299,33 +309,21 @@ def _is_scheduler_ticket(title: str, description: str) -> bool:
     return any(kw in combined for kw in _SCHEDULER_KEYWORDS)
 
 
-def cmd_create(args):
-    root = find_cto_root()
-    tid = next_ticket_id(root)
+def create_ticket(root: Path, fields: dict, tid: Optional[str] = None) -> dict:
+    """Build, save and announce a new ticket from a plain dict of fields.
 
-    # Handle team mode
-    team_mode = getattr(args, 'team_mode', None) or "solo"
-    team_template = getattr(args, 'team_template', None)
-
-    # Validate team template
-    if team_template and team_template not in TEAM_TEMPLATES:
-        print(f"Warning: Unknown team template '{team_template}'. Using solo mode.")
-        team_mode = "solo"
-        team_template = None
+    Recognised keys: title, description, type, priority, complexity, agent,
+    parent, dependencies (list), criteria (list), team_mode, team_template,
+    plus optional status/provides/requires overrides. Allocates the next ID
+    from config unless tid is given (callers creating many tickets reserve a
+    block of IDs up front). Raises ValueError if the title is invalid.
+    """
+    safe_title = sanitize_title(fields.get("title"))
+    safe_description = sanitize_text_input(fields.get("description") or "", max_length=5000)
+    if tid is None:
+        tid = next_ticket_id(root)
 
-    # Auto-suggest team mode for complex tickets
-    if team_mode == "solo" and args.complexity in ("L", "XL"):
-        print(f"  Hint: This is a {args.complexity} ticket. Consider using --team-mode collaborative")
-
-    # Sanitize user inputs to prevent injection attacks
-    try:
-        safe_title = sanitize_title(args.title)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-    safe_description = sanitize_text_input(args.description or "", max_length=5000)
-
-    base_criteria = [c.strip() for c in args.criteria.split("|")] if args.criteria else []
+    base_criteria = [c.strip() for c in fields.get("criteria") or []]
     if _is_scheduler_ticket(safe_title, safe_description):
         existing_set = {c.lower() for c in base_criteria}
         for ac in SCHEDULER_AC:
@@ -333,18 +331,21 @@ def cmd_create(args):
                 base_criteria.append(ac)
         print("  [scheduler] Added runtime-verification AC items (CMO-009 fix). Confirm job is actually loaded, not just printed.")
 
+    team_mode = fields.get("team_mode") or "solo"
+    team_template = fields.get("team_template")
+    complexity = fields.get("complexity") or "M"
     ticket = {
         "id": tid,
         "title": safe_title,
         "description": safe_description,
-        "type": args.type,
-        "status": "backlog",
-        "priority": args.priority,
-        "assigned_agent": getattr(args, 'agent', None),
-        "parent_ticket": args.parent or None,
-        "dependencies": [d.strip() for d in args.depends.split(",")] if args.depends else [],
+        "type": fields["type"],
+        "status": fields.get("status") or "backlog",
+        "priority": fields["priority"],
+        "assigned_agent": fields.get("agent"),
+        "parent_ticket": fields.get("parent") or None,
+        "dependencies": [d.strip() for d in fields.get("dependencies") or []],
         "acceptance_criteria": base_criteria,
-        "estimated_complexity": args.complexity or "M",
+        "estimated_complexity": complexity,
         # Team collaboration fields
         "team_mode": team_mode,
         "team_template": team_template,
@@ -357,19 +358,153 @@ def cmd_create(args):
         "review_notes": None,
         "files_touched": [],
     }
+    if fields.get("provides"):
+        ticket["provides"] = fields["provides"]
+    if fields.get("requires"):
+        ticket["requires"] = list(fields["requires"])
     save_ticket(root, ticket)
 
     # Emit cto.ticket.created event
     emit("cto.ticket.created", {
         "ticket_id": tid,
+        "title": fields.get("title"),
+        "type": fields["type"],
+        "priority": fields["priority"],
+        "complexity": complexity,
+        "team_mode": team_mode,
+        "team_template": team_template,
+        "parent_ticket": fields.get("parent"),
+    }, role="rick")
+    return ticket
+
+
+PLAN_TYPES = ("feature", "bug", "task", "spike", "epic")
+PLAN_PRIORITIES = ("critical", "high", "medium", "low")
+PLAN_COMPLEXITIES = ("XS", "S", "M", "L", "XL")
+
+
+def bulk_create(root: Path, items: list[dict]) -> list[str]:
+    """Create every ticket of a generated plan in one pass.
+
+    items use the plan schema (title, type, priority, complexity, description,
+    acceptance_criteria, provides, requires, parent_index, dependency_indices),
+    where the indices point at earlier items. The whole ID block is reserved
+    with one config write and indices are resolved through a position → id
+    table as tickets are created; non-epic tickets start as todo. Returns the
+    ids in plan order, with "UNKNOWN-<i>" for items that failed validation.
+    """
+    cfg = load_config(root)
+    prefix = cfg["ticket_prefix"]
+    first_num = cfg.get("next_ticket_number", 1)
+    cfg["next_ticket_number"] = first_num + len(items)
+    save_config(root, cfg)
+
+    ids: list[str] = []
+    id_by_index: dict[int, str] = {}
+    for i, item in enumerate(items):
+        ttype = item.get("type", "task")
+        if ttype not in PLAN_TYPES:
+            ttype = "task"
+        priority = item.get("priority", "medium")
+        if priority not in PLAN_PRIORITIES:
+            priority = "medium"
+        complexity = item.get("complexity", "M")
+        if complexity not in PLAN_COMPLEXITIES:
+            complexity = "M"
+
+        parent_idx = item.get("parent_index")
+        parent_id = id_by_index.get(parent_idx) if isinstance(parent_idx, int) and parent_idx < i else None
+        dep_ids = [
+            id_by_index[di] for di in item.get("dependency_indices") or []
+            if isinstance(di, int) and di < i and di in id_by_index
+        ]
+
+        tid = f"{prefix}-{first_num + i:03d}"
+        try:
+            create_ticket(root, {
+                "title": item.get("title", f"Ticket {i}"),
+                "description": item.get("description", ""),
+                "type": ttype,
+                "status": "backlog" if ttype == "epic" else "todo",
+                "priority": priority,
+                "complexity": complexity,
+                "parent": parent_id,
+                "dependencies": dep_ids,
+                "criteria": item.get("acceptance_criteria") or [],
+                "provides": item.get("provides"),
+                "requires": item.get("requires") or [],
+            }, tid=tid)
+        except ValueError as e:
+            print(f"Warning: skipped plan item {i}: {e}", file=sys.stderr)
+            ids.append(f"UNKNOWN-{i}")
+            continue
+        id_by_index[i] = tid
+        ids.append(tid)
+    return ids
+
+
+def cmd_bulk_create(args):
+    """Create a plan's tickets from a JSON array file or stdin (see bulk_create)."""
+    root = find_cto_root()
+    source = args.from_json or "stdin"
+    try:
+        if args.from_json:
+            raw = Path(args.from_json).read_bytes()
+        else:
+            raw = sys.stdin.buffer.read()
+        items = _json_loads(raw)
+    except OSError as e:
+        print(f"Error: cannot read {source}: {e}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error: {source} is not valid JSON: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not isinstance(items, list):
+        print(f"Error: expected a JSON array of plan items in {source}.", file=sys.stderr)
+        sys.exit(1)
+    for item, tid in zip(items, bulk_create(root, items)):
+        if not tid.startswith("UNKNOWN-"):
+            print(f"Created {tid}: {item.get('title', '')}")
+
+
+def cmd_create(args):
+    root = find_cto_root()
+
+    # Handle team mode
+    team_mode = getattr(args, 'team_mode', None) or "solo"
+    team_template = getattr(args, 'team_template', None)
+
+    # Validate team template
+    if team_template and team_template not in TEAM_TEMPLATES:
+        print(f"Warning: Unknown team template '{team_template}'. Using solo mode.")
+        team_mode = "solo"
+        team_template = None
+
+    # Auto-suggest team mode for complex tickets
+    if team_mode == "solo" and args.complexity in ("L", "XL"):
+        print(f"  Hint: This is a {args.complexity} ticket. Consider using --team-mode collaborative")
+
+    # Sanitize user inputs to prevent injection attacks
+    try:
+        sanitize_title(args.title)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    ticket = create_ticket(root, {
         "title": args.title,
+        "description": args.description,
         "type": args.type,
         "priority": args.priority,
-        "complexity": args.complexity or "M",
+        "complexity": args.complexity,
+        "agent": getattr(args, 'agent', None),
+        "parent": args.parent,
+        "dependencies": args.depends.split(",") if args.depends else [],
+        "criteria": args.criteria.split("|") if args.criteria else [],
         "team_mode": team_mode,
         "team_template": team_template,
-        "parent_ticket": args.parent,
-    }, role="rick")
+    })
+    tid = ticket["id"]
 
     team_msg = f" (team: {team_template})" if team_mode == "collaborative" else ""
     print(f"*Burrrp* Created {tid}: {args.title}{team_msg}. Now get to work, Morty.")
@@ -500,20 +635,25 @@ def cmd_next(args):
 
     priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 
-    candidates = []
-    for t in tickets:
-        if t["status"] not in actionable_statuses:
+    # Only the single best ticket is needed: keep the first one seen at the
+    # best rank so far and stop early once a critical one turns up.
+    t = None
+    best_rank = None
+    for cand in tickets:
+        if cand["status"] not in actionable_statuses:
+            continue
+        rank = priority_order.get(cand["priority"], 99)
+        if best_rank is not None and rank >= best_rank:
             continue
-        deps = t.get("dependencies") or []
+        deps = cand.get("dependencies") or []
         if all(d in done_ids for d in deps):
-            candidates.append(t)
+            t, best_rank = cand, rank
+            if rank == 0:
+                break
 
-    candidates.sort(key=lambda t: priority_order.get(t["priority"], 99))
-
-    if not candidates:
+    if t is None:
         print("Nothing to do. Go watch interdimensional cable or something.")
         return
-    t = candidates[0]
     print(f"Alright Morty, here's your next mission: {t['id']} — {t['title']}")
     print(f"  Priority: {t['priority']}  Type: {t['type']}  Complexity: {t.get('estimated_complexity', '?')}")
     if t.get("dependencies"):
@@ -592,6 +732,10 @@ def build_parser():
                    choices=["fullstack-team", "api-team", "security-team", "devops-team"],
                    help="Team template for collaborative mode")
 
+    # bulk-create
+    bc = sub.add_parser("bulk-create", help="Create a plan's tickets from a JSON array (file or stdin)")
+    bc.add_argument("--from-json", default=None, metavar="PATH", help="Plan JSON file (default: read stdin)")
+
     # list
     ls = sub.add_parser("list", help="List tickets")
     ls.add_argument("--status", default=None)
@@ -647,6 +791,7 @@ def main():
 
     dispatch = {
         "create": cmd_create,
+        "bulk-create": cmd_bulk_create,
         "list": cmd_list,
         "update": cmd_update,
         "show": cmd_show,